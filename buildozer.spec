@@ -13,7 +13,7 @@ package.domain = org.test
 source.dir = .
 
 # (list) Source files to include (let empty to include all the files)
-source.include_exts = py,png,jpg,kv,atlas,ttf,sqlite,txt
+source.include_exts = py,png,jpg,kv,atlas,ttf,sqlite,txt,pack
 
 # (list) List of inclusions using pattern matching
 #source.include_patterns = assets/*,images/*.png
@@ -22,11 +22,11 @@ source.include_exts = py,png,jpg,kv,atlas,ttf,sqlite,txt
 #source.exclude_exts = spec
 
 # (list) List of directory to exclude (let empty to not exclude anything)
-#source.exclude_dirs = tests, bin, venv
+source.exclude_dirs = tests, tools, bin, venv
 
 # (list) List of exclusions using pattern matching
 # Do not prefix with './'
-#source.exclude_patterns = license,images/*/*.jpg
+source.exclude_patterns = words.sqlite, DarkLightModeIcon.png, SettingsIcon.png, SettingsIcon2.png
 
 # (str) Application versioning (method 1)
 version = 1.2
@@ -0,0 +1,94 @@
+"""
+The app-lifetime connection to words.sqlite.
+
+The database is never written by the app, so it is opened read-only and `immutable`,
+which lets SQLite skip locking and change detection.
+"""
+import functools
+import pathlib
+import sqlite3
+
+from profiling import profiler
+from word_filter import letters_mask
+
+DB_PATH = "words.sqlite"
+# The whole file fits in the memory map, the page cache is given in KiB (negative value).
+MMAP_SIZE = 16 * 1024 * 1024
+CACHE_SIZE = -4 * 1024
+
+_connection = None
+
+
+def get_connection() -> sqlite3.Connection:
+    """ :returns the shared read-only connection, opening it on the first call."""
+    global _connection
+    if _connection is None:
+        uri = pathlib.Path(DB_PATH).absolute().as_uri() + "?mode=ro&immutable=1"
+        with profiler.measure("db.open"):
+            # Searches run on a background thread while the app closes the connection from the UI thread.
+            _connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            _connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            _connection.execute(f"PRAGMA cache_size = {CACHE_SIZE}")
+    return _connection
+
+
+def close_connection() -> None:
+    """ Closes the shared connection (if it was opened)."""
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+
+@functools.lru_cache(maxsize=None)
+def build_search_query(known_positions: tuple[int, ...], forbidden_positions: tuple[int, ...] = (),
+                       min_counts: int = 0, max_counts: int = 0) -> str:
+    """
+    :returns the parameterised query for a constraint shape. The same shape always gives the same
+    text, so sqlite3 reuses its prepared statement from the connection's statement cache.
+    It relies on the columns and indexes added by tools/migrate_schema.py.
+    """
+    conditions = ["length = 5"]
+    conditions += [f"c{index} = ?" for index in known_positions]
+    conditions += ["mask & ? = ?", "mask & ? = 0"]
+    conditions += [f"c{index} != ?" for index in forbidden_positions]
+    # The number of times a letter appears is the length lost when it is removed.
+    conditions += ["5 - length(replace(word, ?, '')) >= ?"] * min_counts
+    conditions += ["5 - length(replace(word, ?, '')) <= ?"] * max_counts
+
+    return f"SELECT word FROM words WHERE {' AND '.join(conditions)} ORDER BY probability DESC, rowid"
+
+
+def search_words(known_letters: list[tuple[str, int]], existent_letters: list[str],
+                 nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+                 min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = ()) -> list[str]:
+    """ Lets SQLite filter the words. :returns, in order, every word that meets the requirements."""
+    known_letters = sorted(known_letters, key=lambda known: known[1])
+    forbidden_positions = sorted(forbidden_positions, key=lambda forbidden: forbidden[1])
+    # Counts of 0 and 1 are handled by the masks.
+    required = letters_mask(existent_letters) | letters_mask(letter for letter, count in min_counts if count)
+    forbidden = letters_mask(nonexistent_letters) | letters_mask(letter for letter, count in max_counts if not count)
+    min_counts = [(letter, count) for letter, count in min_counts if count > 1]
+    max_counts = [(letter, count) for letter, count in max_counts if count > 0]
+
+    query = build_search_query(tuple(index for _, index in known_letters),
+                               tuple(index for _, index in forbidden_positions), len(min_counts), len(max_counts))
+    parameters = [letter for letter, _ in known_letters] + [required, required, forbidden]
+    parameters += [letter for letter, _ in forbidden_positions]
+    for letter, count in min_counts + max_counts:
+        parameters += [letter, count]
+
+    return [db_line[0] for db_line in get_connection().execute(query, parameters)]
+
+
+class SqlWordSearch:
+    """ Search backend with the same interface as word_filter.IncrementalSearch that filters inside SQLite."""
+
+    def search(self, known_letters: list[tuple[str, int]], existent_letters: list[str],
+               nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+               min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = ()) -> list[str]:
+        return search_words(known_letters, existent_letters, nonexistent_letters, forbidden_positions,
+                            min_counts, max_counts)
+
+    def reset(self) -> None:
+        pass
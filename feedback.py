@@ -0,0 +1,189 @@
+"""
+Wordle feedback patterns and entropy-ranked guess suggestions.
+
+A pattern is the colours of the 5 tiles encoded in base 3 (tile 0 is the lowest digit):
+    0 - grey, 1 - yellow, 2 - green
+so every pattern fits into an uint8 (3 ** 5 = 243 patterns).
+
+The feedback matrix stores the pattern of every guess against every answer of the words pack
+(row = guess, column = answer, both in pack order). It is built at packaging time by
+tools/build_feedback_matrix.py and memory-mapped by `FeedbackMatrix`.
+
+File layout: magic b"WHFM", word count and CRC-32 of the pack words (u32, little endian),
+then count * count uint8 patterns. The checksum ties the matrix to the words pack it was built from.
+"""
+import math
+import mmap
+import struct
+import zlib
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, the pure-Python path is used without it.
+    numpy = None
+
+MATRIX_PATH = "feedback.matrix"
+MAGIC = b"WHFM"
+HEADER = struct.Struct("<4sII")
+
+GREY, YELLOW, GREEN = 0, 1, 2
+PATTERN_COUNT = 3 ** 5
+ALL_GREEN = PATTERN_COUNT - 1
+# Scoring cost grows with the candidates, bigger sets get no suggestions (the starting words cover them).
+CANDIDATES_LIMIT = 1000
+# Without NumPy only the candidates themselves are scored as guesses, and only for small candidate sets.
+PURE_PYTHON_CANDIDATES_LIMIT = 300
+
+
+def feedback_pattern(guess: str, answer: str) -> int:
+    """
+    :returns the pattern Wordle shows for `guess` when the word is `answer`.
+    Repeated letters are yellow only as many times as the letter is still unmatched in the answer
+    (the leftmost occurrences first).
+    """
+    states = [GREY] * len(guess)
+    unmatched = Counter()
+    for index, (guess_letter, answer_letter) in enumerate(zip(guess, answer)):
+        if guess_letter == answer_letter:
+            states[index] = GREEN
+        else:
+            unmatched[answer_letter] += 1
+
+    for index, guess_letter in enumerate(guess):
+        if states[index] != GREEN and unmatched[guess_letter] > 0:
+            states[index] = YELLOW
+            unmatched[guess_letter] -= 1
+
+    return sum(state * 3 ** index for index, state in enumerate(states))
+
+
+def pattern_states(pattern: int, length: int = 5) -> list[int]:
+    """ :returns the GREY/YELLOW/GREEN state of each tile of the `pattern`."""
+    return [pattern // 3 ** index % 3 for index in range(length)]
+
+
+def pattern_row(guess: str, letters):
+    """
+    Vectorised `feedback_pattern` of one guess against every answer.
+    :param letters: (N, 5) uint8 array with the ASCII codes of the answers
+    :returns an (N,) uint8 array of patterns
+    """
+    guess_codes = [ord(letter) for letter in guess]
+    greens = letters == numpy.array(guess_codes, dtype=numpy.uint8)
+    # How many times each letter of the guess is unmatched in each answer.
+    unmatched = {code: ((letters == code) & ~greens).sum(axis=1) for code in set(guess_codes)}
+    used = {code: numpy.zeros(len(letters), dtype=numpy.int64) for code in set(guess_codes)}
+
+    pattern = numpy.zeros(len(letters), dtype=numpy.int64)
+    for index, code in enumerate(guess_codes):
+        not_green = ~greens[:, index]
+        yellows = not_green & (used[code] < unmatched[code])
+        used[code] += not_green
+        pattern += (GREEN * greens[:, index] + YELLOW * yellows) * 3 ** index
+
+    return pattern.astype(numpy.uint8)
+
+
+def pack_checksum(word_pack) -> int:
+    """ :returns the CRC-32 of the words of the `word_pack` (a wordpack.WordPack)."""
+    return zlib.crc32(word_pack.word_bytes)
+
+
+def write_matrix_header(matrix_file, count: int, checksum: int) -> None:
+    matrix_file.write(HEADER.pack(MAGIC, count, checksum))
+
+
+class FeedbackMatrix:
+    """ The memory-mapped guess x answer pattern matrix."""
+
+    def __init__(self, path: str = MATRIX_PATH):
+        with open(path, "rb") as matrix_file:
+            self._mmap = mmap.mmap(matrix_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"{path} is not a complete feedback matrix")
+        magic, self.count, self.pack_checksum = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or len(self._mmap) != HEADER.size + self.count * self.count:
+            raise ValueError(f"{path} is not a complete feedback matrix")
+
+        if numpy is not None:
+            self.patterns = numpy.frombuffer(self._mmap, dtype=numpy.uint8, offset=HEADER.size).reshape(
+                self.count, self.count)
+        else:
+            self.patterns = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def matches(self, word_pack) -> bool:
+        """ :returns whether the matrix was built from the words of `word_pack` (a stale matrix names wrong words)."""
+        return self.count == len(word_pack) and self.pack_checksum == pack_checksum(word_pack)
+
+    def row(self, guess: int) -> bytes:
+        """ :returns the patterns of the `guess` (a position in the words pack) against every answer."""
+        start = HEADER.size + guess * self.count
+        return self._mmap[start:start + self.count]
+
+
+def entropy(counts) -> float:
+    """ :returns the entropy (in bits) of the pattern distribution given by the `counts`."""
+    total = sum(counts)
+    return math.log2(total) - sum(count * math.log2(count) for count in counts if count) / total
+
+
+def pattern_counts(patterns):
+    """
+    :param patterns: (G, A) uint8 array, the patterns of G guesses against A answers
+    :returns a (G, 243) array with how many answers give each pattern for each guess
+    """
+    guess_count = patterns.shape[0]
+    offsets = (numpy.arange(guess_count, dtype=numpy.int64) * PATTERN_COUNT)[:, None]
+    return numpy.bincount((patterns + offsets).ravel(),
+                          minlength=guess_count * PATTERN_COUNT).reshape(guess_count, PATTERN_COUNT)
+
+
+def entropies(counts):
+    """ Vectorised `entropy` of every row of `counts` (see `pattern_counts`)."""
+    total = counts.sum(axis=1)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        weighted = numpy.where(counts > 0, counts * numpy.log2(counts), 0.0).sum(axis=1)
+    return numpy.log2(total) - weighted / total
+
+
+def expected_remaining(counts):
+    """ :returns for every row of `counts` the expected number of answers left after the guess."""
+    return (counts.astype(numpy.float64) ** 2).sum(axis=1) / counts.sum(axis=1)
+
+
+def suggest_guesses(matrix: FeedbackMatrix, candidates, count: int = 10) -> list[tuple[int, float]]:
+    """
+    Scores guesses by the expected information (entropy of the feedback pattern) over the `candidates`
+    (positions in the words pack, in probability order).
+    :returns the `count` best (guess position, bits) pairs. On equal scores a guess that can still be
+    the answer comes first.
+    """
+    candidates = list(candidates)
+    if len(candidates) <= 1:
+        return [(position, 0.0) for position in candidates]
+    if len(candidates) > CANDIDATES_LIMIT:
+        return []
+
+    if matrix.patterns is not None:
+        scores = entropies(pattern_counts(matrix.patterns[:, numpy.asarray(candidates, dtype=numpy.intp)]))
+        guess_count = len(scores)
+
+        is_candidate = numpy.zeros(guess_count, dtype=bool)
+        is_candidate[candidates] = True
+        # lexsort sorts by the last key first: best score, then candidates, then pack order.
+        order = numpy.lexsort((numpy.arange(guess_count), ~is_candidate, -scores))[:count]
+        return [(int(position), float(scores[position])) for position in order]
+
+    if len(candidates) > PURE_PYTHON_CANDIDATES_LIMIT:
+        return []
+    scored = []
+    for guess in candidates:
+        row = matrix.row(guess)
+        scored.append((guess, entropy(Counter(row[answer] for answer in candidates).values())))
+    scored.sort(key=lambda item: -item[1])
+    return scored[:count]
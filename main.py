@@ -1,141 +1,233 @@
-import datetime
-import sqlite3
+import time
+
+# Measured from here (before Kivy is imported) to the first frame, see WHApplication.report_startup.
+STARTED = time.perf_counter()
+
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from kivy.app import App
+from kivy.clock import Clock
 from kivy.core.window import Window
+from kivy.factory import Factory
 from kivy.graphics import Color, Rectangle
 from kivy.lang import Builder
+from kivy.logger import Logger
 from kivy.metrics import dp, sp
+from kivy.properties import BooleanProperty
 from kivy.uix.anchorlayout import AnchorLayout
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.button import Button
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
-from kivy.uix.popup import Popup
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleview.views import RecycleDataViewBehavior
 from kivy.uix.screenmanager import Screen
 from kivy.uix.textinput import TextInput
 from kivy.utils import get_color_from_hex
 
-Builder.load_file('style.kv')
+import profiling
+from profiling import profiler
+from theme import theme
 
+# The settings popup (and Popup itself) is only imported the first time it is opened.
+Factory.register("SettingsPopup", module="settings_popup")
 
-class DarkMode:
-    """
-    Class that gives the ability to every class that inherits from it to switch
-    to dark mode if the `change_appearance` method has been configured properly.
-    """
+# "memory" filters the words of words5.pack in memory, "sql" lets SQLite filter them (see solver.Solver).
+# words.sqlite is not shipped in the APK, so "sql" only works on desktop.
+SEARCH_BACKEND = os.environ.get("WORDLEHELPER_SEARCH_BACKEND", "memory")
+# How many entropy-ranked guesses are shown above the candidates.
+SUGGESTIONS_COUNT = 5
+# With live search on, the search runs once nothing changed for this many seconds.
+LIVE_SEARCH_DELAY = 0.3
+# The first rows of a result (a screenful) are displayed at once, the others DISPLAY_CHUNK rows per frame.
+FIRST_ROWS = 30
+DISPLAY_CHUNK = 1000
 
-    def __init__(self, **kwargs):
-        hour = datetime.datetime.now().hour
-        if hour <= 6 or hour >= 18:
-            self._night_mode = True
-        else:
-            self._night_mode = False
 
-    def toggle_dark_mode(self) -> None:
-        if self._night_mode is True:
-            self._night_mode = False
-        else:
-            self._night_mode = True
-        self.change_appearance()
+def after_next_frame(callback) -> None:
+    """
+    Calls `callback()` once the next frame has been drawn and shown.
+    (Clock callbacks, even those scheduled for the next frame, run before the frame is drawn.)
+    """
+    def on_flip(window):
+        window.unbind(on_flip=on_flip)
+        callback()
 
-    def change_appearance(self) -> None:
-        """
-        if self._night_mode (is True):
-            How the object should look when using dark mode.
-        else (self._night_mode is False):
-            How the object should look when using light mode.
-        """
-        pass
+    Window.bind(on_flip=on_flip)
 
 
-class WHScreen(Screen, DarkMode):
+class WHScreen(Screen):
     """ Is the main screen for the WordleHelper app. """
+    # Searches automatically when the letters, the key states or the guesses change (set in the settings popup).
+    live_search = BooleanProperty(False)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.background = None
-
-        self.create_background("#e9ecef")
-        self.change_appearance()
-
-    def create_background(self, color: str) -> None:
-        """ Creates a background of Color `color`."""
-        c = self.canvas.before
-        if len(c.children) > 2:
-            del c.children[3:]
-
-        with c:
-            Color(*get_color_from_hex(color))
+        self.background_color = None
+        # The solver.Solver, created (with its imports and the dictionary) on the search thread after
+        # the first frame, see `start_solver`. It is only used on the search thread, so the UI never waits for it.
+        self.solver = None
+        self.search_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="search")
+        self.pending_search = None
+        self.pending_ranking = None
+        # Incremented for every search, only the result of the newest one is displayed.
+        self.search_generation = 0
+        self.live_search_trigger = Clock.create_trigger(lambda dt: self.search_words(
+            self.ids.input_layout, self.ids.keyboard_layout, self.ids.words_displayer, self.ids.guess_history),
+            LIVE_SEARCH_DELAY)
+
+        self.create_background(theme.background_color)
+        theme.bind(background_color=self.change_appearance)
+
+        if profiler.enabled:
+            # Added last, so it is drawn above the rest of the screen.
+            self.add_widget(ProfilerOverlay())
+
+    def create_background(self, color: list[float]) -> None:
+        """ Creates a background of Color `color` (rgba), or only changes the colour if it already exists."""
+        if self.background is not None:
+            self.background_color.rgba = color
+            return
+
+        with self.canvas.before:
+            self.background_color = Color(*color)
             self.background = Rectangle(size=self.size, pos=self.pos)
-            self.bind(size=self.update_rect, pos=self.update_rect)
+        self.bind(size=self.update_rect, pos=self.update_rect)
 
     def update_rect(self, instance, widget) -> None:
         """Updates the size of the rectangle whenever the user changes the window size"""
         self.background.pos = instance.pos
         self.background.size = instance.size
 
-    def toggle_dark_mode(self) -> None:
-        super(WHScreen, self).toggle_dark_mode()
-        self.search_for_night_mode(self.children)
-
-    def change_appearance(self) -> None:
-        if self._night_mode:
-            self.create_background("#495057")
-        else:
-            self.create_background("#e9ecef")
+    def change_appearance(self, instance, background_color) -> None:
+        """ Called when the background colour of the theme changes (see theme.Theme)."""
+        self.create_background(background_color)
 
-    def search_for_night_mode(self, children) -> None:
+    def search_words(self, input_layout, keyboard_layout, word_displayer, guess_history=None) -> None:
         """
-        Searches every widget by recursively accessing every widget's children and
-        activates the dark mode for each one of them
+        Searches the words that meet the requirements on the search thread and displays them when ready.
+        The requirements are the letters of the inputs and the keyboard plus the rows of the `guess_history`.
+        The best guesses are ranked afterwards, on the search thread too, and added above the words when ready.
+        A newer search cancels (or, if it already started, supersedes) the previous one and its ranking.
         """
-
-        if children:
-            for child in children:
-                if hasattr(child, "change_appearance") and callable(getattr(child, "change_appearance")):
-                    child.toggle_dark_mode()
-                self.search_for_night_mode(child.children)
-
-    def search_words(self, input_layout, keyboard_layout, word_displayer) -> None:
-        """ Checks every word and displays them if they meet the requirements."""
         known = input_layout.get_known_letters()
         existent = keyboard_layout.get_existent_letters()
         nonexistent = keyboard_layout.get_nonexistent_letters()
+        feedback = guess_history.get_feedback() if guess_history is not None else []
+
+        self.search_generation += 1
+        generation = self.search_generation
+        for pending in (self.pending_search, self.pending_ranking):
+            if pending is not None:
+                pending.cancel()
+
+        started = time.perf_counter()
+        self.pending_search = self.search_executor.submit(self.find_words, known, existent, nonexistent, feedback)
+        self.pending_search.add_done_callback(
+            lambda future: Clock.schedule_once(lambda dt: self.show_words(future, generation, word_displayer,
+                                                                          started)))
+        # Queued right behind the search, so the words are displayed without waiting for the ranking.
+        self.pending_ranking = self.search_executor.submit(self.rank_words, generation)
+        self.pending_ranking.add_done_callback(
+            lambda future: Clock.schedule_once(lambda dt: self.show_suggestions(future, generation, word_displayer)))
+
+    def request_live_search(self) -> None:
+        """
+        Called when a letter, a key state or a guess changes. With live search on, searches once the changes stop:
+        every change restarts the delay, so typing a word runs a single search.
+        """
+        if self.live_search:
+            self.live_search_trigger.cancel()
+            self.live_search_trigger()
 
-        def word_retriever(known_letters: list[tuple[str, int]], existent_letters: list[str],
-                           nonexistent_letters: list[str]) -> str:
-            """ Generator that yields each words that meets the specified requirements."""
-            connection = sqlite3.connect("words.sqlite")
+    def on_live_search(self, instance, live_search: bool) -> None:
+        if live_search:
+            self.request_live_search()
 
-            def check_word(word: str) -> bool:
-                """
-                Checks the length, then checks the if yellow letters are in the word.
-                then checks if the red letters are not in the word,
-                then checks if the letters in the 5 Inputs letters are in the correct position.
-                """
-                if len(word) != 5:
-                    return False
+    def start_solver(self) -> None:
+        """ Creates the solver and loads the dictionary on the search thread."""
+        self.search_executor.submit(self._create_solver)
 
-                for existent_letter in existent_letters:
-                    if existent_letter not in word:
-                        return False
+    def _create_solver(self) -> None:
+        if self.solver is None:
+            from solver import Solver
 
-                for nonexistent_letter in nonexistent_letters:
-                    if nonexistent_letter in word:
-                        return False
+            self.solver = Solver(SEARCH_BACKEND)
+            with profiler.measure("solver.load"):
+                self.solver.load()
 
-                for letter, index in known_letters:
-                    if word[index] != letter:
-                        return False
-                return True
+    def find_words(self, known: list[tuple[str, int]], existent: list[str], nonexistent: list[str],
+                   feedback: list[tuple[str, int]]) -> list[str]:
+        """
+        Runs on the search thread.
+        :returns every word that meets the requirements.
+        """
+        from solver import Constraints, constraints_from_feedback, merge_constraints
+
+        self._create_solver()
+        constraints = Constraints(known=known, existent=existent, nonexistent=nonexistent)
+        if feedback:
+            constraints = merge_constraints(constraints, constraints_from_feedback(feedback))
 
-            for db_line in connection.execute("SELECT word from WORDS ORDER BY probability DESC"):
-                if check_word(db_line[0]):
-                    yield db_line[0]
+        with profiler.measure("search.filter"):
+            return self.solver.search(constraints)
+
+    def rank_words(self, generation: int) -> list[tuple[str, float]]:
+        """
+        Runs on the search thread, after `find_words`.
+        :returns the best next guesses for the words found with their expected information,
+        nothing if a newer search was started in the meantime.
+        """
+        if self.solver is None or generation != self.search_generation:
+            return []
+        with profiler.measure("search.rank"):
+            return self.solver.suggest(SUGGESTIONS_COUNT)
 
-        word_generator = word_retriever(known, existent, nonexistent)
-        word_displayer.display_words(word_generator)
+    def show_words(self, future, generation: int, word_displayer, started: float = None) -> None:
+        """
+        Runs on the UI thread. Displays the result of a search unless a newer one was started.
+        `started` is when the search was requested, the search is timed until the next frame shows the first words.
+        """
+        if future.cancelled() or generation != self.search_generation:
+            return
+        if future.exception() is not None:
+            Logger.error("WordleHelper: the search failed", exc_info=future.exception())
+            return
+        with profiler.measure("search.display"):
+            word_displayer.display_words(future.result())
+        if profiler.enabled and started is not None:
+            # The WordLabels are created and laid out in the next frame.
+            after_next_frame(lambda: profiler.record("search.total", time.perf_counter() - started))
+
+    def show_suggestions(self, future, generation: int, word_displayer) -> None:
+        """ Runs on the UI thread. Adds the best guesses above the words unless a newer search was started."""
+        if future.cancelled() or generation != self.search_generation:
+            return
+        if future.exception() is not None:
+            Logger.error("WordleHelper: ranking the guesses failed", exc_info=future.exception())
+            return
+        suggestions = future.result()
+        if suggestions:
+            word_displayer.display_suggestions(suggestions)
+
+    def reset_search(self) -> None:
+        """ Forgets the previous result, so the next search starts from the whole dictionary."""
+        self.live_search_trigger.cancel()
+        self.search_generation += 1
+        self.search_executor.submit(self._reset_solver)
+
+    def _reset_solver(self) -> None:
+        if self.solver is not None:
+            self.solver.reset()
+
+    def stop_search(self) -> None:
+        """ Drops the pending searches, stops the search thread and closes the solver."""
+        self.search_generation += 1
+        self.search_executor.shutdown(wait=True, cancel_futures=True)
+        if self.solver is not None:
+            self.solver.close()
 
 
 class LetterInput(TextInput):
@@ -143,10 +235,10 @@ class LetterInput(TextInput):
 
     def insert_text(self, substring, from_undo=False):
         """
-        Transforms the input into uppercase and accepts if only if it is a letter.
+        Transforms the input into uppercase and accepts if only if it is a letter (a-z, the words have no accents).
         The entry can only hold 1 letter at a time.
         """
-        if substring.isalpha():
+        if substring.isascii() and substring.isalpha():
             self.text = ''
             substring = substring.upper()
         else:
@@ -156,7 +248,9 @@ class LetterInput(TextInput):
 
 
 class InputLayout(BoxLayout):
-    """ Layout that contains five TextInputs for each letter of the word."""
+    """ Layout that contains five TextInputs for each letter of the word. Dispatches `on_letters_change`."""
+    __events__ = ("on_letters_change",)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.window_size = Window.size
@@ -166,6 +260,7 @@ class InputLayout(BoxLayout):
             temp_input = LetterInput(size_hint=(None, None),
                                      multiline=False,
                                      font_size=sp(22))
+            temp_input.bind(text=lambda *_: self.dispatch("on_letters_change"))
             self.entries.append(temp_input)
             self.add_widget(self.entries[-1])
 
@@ -177,6 +272,13 @@ class InputLayout(BoxLayout):
 
         return spacing
 
+    def on_letters_change(self) -> None:
+        pass
+
+    def clear_letters(self) -> None:
+        for entry in self.entries:
+            entry.text = ''
+
     def get_known_letters(self) -> list[tuple[str, int]]:
         """ :returns a list with the letters in the TextInputs and their position in the word."""
         known_letters = []
@@ -232,7 +334,8 @@ class LetterButton(Button):
 
 
 class LettersLayout(GridLayout):
-    """ Creates a keyboard of LetterButtons to help the user type the instructions."""
+    """ Creates a keyboard of LetterButtons to help the user type the instructions. Dispatches `on_letters_change`."""
+    __events__ = ("on_letters_change",)
 
     KEYBOARD = ['qwertyuiop', 'asdfghjkl', 'zxcvbnm']
 
@@ -248,6 +351,7 @@ class LettersLayout(GridLayout):
                 self.letters.append(LetterButton(text=let.upper(),
                                                  size_hint=(None, None),
                                                  size=(Window.width / len(row), dp(40))))
+                self.letters[-1].bind(on_press=lambda _: self.dispatch("on_letters_change"))
                 self.children[0].add_widget(self.letters[-1])
 
                 self.children[0].size_hint_y = None
@@ -262,6 +366,16 @@ class LettersLayout(GridLayout):
             for letter in row.children:
                 letter.width = Window.width / len(row.children)
 
+    def on_letters_change(self) -> None:
+        pass
+
+    def reset_letters(self) -> None:
+        """ Sets every letter back to UNKNOWN."""
+        for letter in self.letters:
+            letter.letter_state = LetterButton.UNKNOWN
+            letter.change_color()
+        self.dispatch("on_letters_change")
+
     def get_existent_letters(self) -> list[str]:
         """ :returns a list of the yellow letters (the ones that are in the word)."""
         existent_letters = []
@@ -281,113 +395,248 @@ class LettersLayout(GridLayout):
         return nonexistent_letters
 
 
-class WordsDisplayerPanel(AnchorLayout):
-    """ An AnchorLayout that adjusts its according to the window height and the words displayed."""
-    def get_height(self, words_displayer_height: int, main_panel_height: int):
-        if words_displayer_height > main_panel_height - 60:
-            return main_panel_height - 60
-        else:
-            return words_displayer_height
+class GuessInput(TextInput):
+    """ TextInput that accepts up to 5 letters a-z (a guess) and transforms them into uppercase."""
 
+    def insert_text(self, substring, from_undo=False):
+        substring = "".join(letter for letter in substring if letter.isascii() and letter.isalpha()).upper()
+        substring = substring[:max(0, 5 - len(self.text))]
+        return super().insert_text(substring, from_undo=from_undo)
+
+
+class FeedbackTile(Button):
+    """
+    A tile of a played guess. Pressing it changes the colour Wordle gave it in this order:
+        GREY - YELLOW - GREEN
+    """
+    # STATES (the tile values of feedback.feedback_pattern)
+    GREY = 0
+    YELLOW = 1
+    GREEN = 2
+
+    states_colors = {
+        GREY: get_color_from_hex("#787c7e"),
+        YELLOW: get_color_from_hex("#ffd90f"),
+        GREEN: get_color_from_hex("#558d4e"),
+    }
 
-class WordsDisplayer(GridLayout, DarkMode):
-    """ A GridLayout that displays all the possible words that app found."""
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.background = None
-        self.load_starting_words()
-
-    def create_background(self, color: str):
-        c = self.canvas.before
-        if len(c.children) > 2:
-            del c.children[3:]
+        self.tile_state = FeedbackTile.GREY
+        self.change_color()
 
-        with c:
-            Color(*get_color_from_hex(color))
-            self.background = Rectangle(size=self.size, pos=self.pos)
-            self.bind(size=self.update_rect, pos=self.update_rect)
+    def on_press(self):
+        self.tile_state = (self.tile_state + 1) % 3
+        self.change_color()
 
-    def update_rect(self, instance, widget):
-        self.background.pos = instance.pos
-        self.background.size = instance.size
+    def change_color(self):
+        self.background_color = FeedbackTile.states_colors[self.tile_state]
 
-    def change_appearance(self):
-        if self._night_mode:
-            for label in self.children:
-                label.color = (1, 1, 1)
-        else:
-            for label in self.children:
-                label.color = (0, 0, 0)
 
-    def load_starting_words(self):
-        """ Loads the best starting words to give the user the best way to start a game."""
+class GuessRow(BoxLayout):
+    """ A played guess: five FeedbackTiles and a button that removes the row."""
 
-        self.clear_widgets()
+    def __init__(self, guess: str, history, **kwargs):
+        super().__init__(**kwargs)
+        self.guess = guess
+        self.tiles = []
+        self.size_hint = (None, None)
+        self.height = dp(40)
+        self.width = 6 * dp(40) + 5 * dp(5)
+        self.spacing = dp(5)
+        self.pos_hint = {"center_x": .5}
+
+        for letter in guess:
+            self.tiles.append(FeedbackTile(text=letter.upper(), bold=True,
+                                           on_press=lambda _: history.dispatch("on_feedback_change")))
+            self.add_widget(self.tiles[-1])
+        self.add_widget(Button(text="X", background_color=(0, 0, 0, 0), color=(1, 0, 0, 1),
+                               on_press=lambda _: history.remove_row(self)))
+
+    def get_pattern(self) -> int:
+        """ :returns the feedback pattern of the row (see feedback.feedback_pattern)."""
+        return sum(tile.tile_state * 3 ** index for index, tile in enumerate(self.tiles))
+
+
+class GuessHistory(BoxLayout):
+    """
+    The guesses played so far, one GuessRow each, with the colours Wordle gave them.
+    Adding a row only makes the search stricter, so the next search only filters the previous result.
+    Dispatches `on_feedback_change` when a row is added or removed or a tile changes.
+    """
+    __events__ = ("on_feedback_change",)
 
-        with open("starting_words.txt", "r", encoding='utf-8') as words_file:
-            starting_words = [word.lower().strip() for word in words_file.readline().split()]
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.orientation = "vertical"
+        self.spacing = dp(5)
+        self.size_hint_y = None
+        self.rows = []
+        self.bind(minimum_height=self.setter("height"))
 
-        self.add_widget(Label(text="BEST STARTING WORDS",
-                              size_hint=(1, None),
-                              height=dp(40),
-                              bold=True))
+    def add_guess(self, guess: str) -> bool:
+        """
+        Adds a row for the `guess` (ignored unless it has 5 letters a-z), every tile starts GREY.
+        :returns whether the row was added.
+        """
+        if len(guess) != 5 or not (guess.isascii() and guess.isalpha()):
+            return False
+        self.rows.append(GuessRow(guess.lower(), self))
+        self.add_widget(self.rows[-1])
+        self.dispatch("on_feedback_change")
+        return True
+
+    def remove_row(self, row: GuessRow) -> None:
+        self.rows.remove(row)
+        self.remove_widget(row)
+        self.dispatch("on_feedback_change")
+
+    def on_feedback_change(self) -> None:
+        pass
 
-        for word in starting_words:
-            self.add_widget(Label(text=word,
-                                  size_hint=(1, None),
-                                  height=dp(40)))
+    def clear_rows(self) -> None:
+        for row in list(self.rows):
+            self.remove_row(row)
 
-        # Modify text color depending on Dark Mode status
-        self.change_appearance()
+    def get_feedback(self) -> list[tuple[str, int]]:
+        """ :returns the (guess, pattern) pair of every row."""
+        return [(row.guess, row.get_pattern()) for row in self.rows]
 
-    def display_words(self, words_list):
-        """ Displays the words that the app has found."""
-        self.clear_widgets()
-        word_number = 0
-        for word in words_list:
-            word_number += 1
-            self.add_widget(Label(text=word,
-                                  size_hint=(1, None),
-                                  height=dp(40)))
-            if word_number >= 200:
-                break
 
-        self.change_appearance()
+class WordsDisplayerPanel(AnchorLayout):
+    """ An AnchorLayout that adjusts its according to the window height and the words displayed."""
+    def get_height(self, words_displayer_height: int, main_panel_height: int):
+        if words_displayer_height > main_panel_height - 60:
+            return main_panel_height - 60
+        else:
+            return words_displayer_height
 
 
-# class TextLayout(AnchorLayout):
+class WordLabel(RecycleDataViewBehavior, Label):
+    """ The (recycled) label that shows one word in the WordsDisplayer. Its colour is bound to the theme in style.kv."""
 
 
-class SettingsPopup(Popup):
-    def __init__(self, entry_layout, keyboard_layout, words_displayer, **kwargs):
+class WordsDisplayer(RecycleView):
+    """
+    A RecycleView that displays all the possible words that app found.
+    Only the visible rows have a WordLabel, so any number of words can be shown.
+    """
+    def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.el = entry_layout
-        self.kl = keyboard_layout
-        self.wd = words_displayer
+        # The words of the displayed result, how many of them are already in `data` and the index of the counter row.
+        self.words = []
+        self.shown_words = 0
+        self.counter_index = None
+        self.append_trigger = Clock.create_trigger(self.append_words)
+        # Filled in after the first frame is shown, so reading the file does not delay it.
+        after_next_frame(self.load_starting_words)
 
-    def reset_game(self):
-        for entry in self.el.children:
-            entry.text = ''
-        for letter in self.kl.letters:
-            letter.letter_state = LetterButton.UNKNOWN
-            letter.change_color()
+    def load_starting_words(self):
+        """
+        Loads the best starting words to give the user the best way to start a game.
+        starting_words.txt (see tools/generate_starting_words.py) has one "WORD score" line per word, best first,
+        and a first comment line that describes the score.
+        """
+        with open("starting_words.txt", "r", encoding='utf-8') as words_file:
+            lines = [line.split() for line in words_file if line.strip()]
+
+        data = [{"text": "BEST STARTING WORDS", "bold": True}]
+        for line in lines:
+            if line[0] == "#":
+                continue
+            text = line[0].lower() if len(line) == 1 else f"{line[0].lower()}  ({line[1]})"
+            data.append({"text": text, "bold": False})
+        self.stop_streaming()
+        self.data = data
+        self.scroll_y = 1
 
-        self.wd.load_starting_words()
+    def display_words(self, words_list):
+        """
+        Displays the words that the app has found: the first screenful at once, the others in the next frames
+        (laying out thousands of rows at once would delay the frame), under a "N CANDIDATES" row that counts
+        the words displayed so far.
+        """
+        self.stop_streaming()
+        self.words = words_list
+        self.shown_words = min(FIRST_ROWS, len(words_list))
+        self.counter_index = 0
+        self.data = [self.counter_row()] + [{"text": word, "bold": False} for word in words_list[:self.shown_words]]
+        self.scroll_y = 1
+        if self.shown_words < len(self.words):
+            self.append_trigger()
+
+    def display_suggestions(self, suggestions) -> None:
+        """ Adds the `suggestions` ((word, bits) pairs) above the words displayed by `display_words`."""
+        data = [{"text": "BEST GUESSES", "bold": True}]
+        data += [{"text": f"{word}  ({bits:.2f} bits)", "bold": False} for word, bits in suggestions]
+        self.counter_index += len(data)
+        # Suggestions are only ranked for small results, so the whole list is cheap to replace.
+        self.data = data + list(self.data)
+
+    def append_words(self, dt) -> None:
+        """ Appends the next DISPLAY_CHUNK words of the result, one chunk per frame."""
+        start = self.shown_words
+        self.shown_words = min(start + DISPLAY_CHUNK, len(self.words))
+        self.data.extend({"text": word, "bold": False} for word in self.words[start:self.shown_words])
+        self.data[self.counter_index] = self.counter_row()
+        if self.shown_words < len(self.words):
+            self.append_trigger()
+
+    def counter_row(self) -> dict:
+        if self.shown_words < len(self.words):
+            return {"text": f"{self.shown_words} OF {len(self.words)} CANDIDATES", "bold": True}
+        return {"text": f"{len(self.words)} CANDIDATES", "bold": True}
+
+    def stop_streaming(self) -> None:
+        """ Drops the words of the previous result that are not displayed yet."""
+        self.append_trigger.cancel()
+        self.words = []
+        self.shown_words = 0
+        self.counter_index = None
+
+
+class ProfilerOverlay(Label):
+    """ Shows the latest timings of the profiler (see profiling.py) above the screen."""
+
+    # How many timings are shown.
+    LINES = 8
 
-        self.dismiss()
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        profiler.listeners.append(lambda name, milliseconds: Clock.schedule_once(lambda dt: self.update()))
+        self.update()
 
-    def get_instructions(self):
-        with open("instructions.txt", "r", encoding='utf-8') as instructions_file:
-            instructions = instructions_file.readlines()
-        text_to_output = "".join(instructions)
-        return text_to_output
+    def update(self) -> None:
+        self.text = "\n".join(f"{name}  {milliseconds:.1f} ms"
+                              for name, milliseconds in profiler.timings[-ProfilerOverlay.LINES:])
+
+
+# class TextLayout(AnchorLayout):
 
 
 class WHApplication(App):
     def build(self):
-        s = WHScreen()
+        if profiler.enabled:
+            profiler.log_path = os.path.join(self.user_data_dir, profiling.LOG_PATH)
+        with profiler.measure("app.build"):
+            with profiler.measure("builder.load_file"):
+                Builder.load_file('style.kv')
+            s = WHScreen()
         return s
 
+    def on_start(self):
+        # Runs before the first frame is drawn: everything else waits until it is shown.
+        after_next_frame(self.report_startup)
+        after_next_frame(self.root.start_solver)
+
+    def report_startup(self) -> None:
+        self.startup_time = time.perf_counter() - STARTED
+        profiler.record("app.first_frame", self.startup_time)
+        Logger.info(f"WordleHelper: first frame {self.startup_time * 1000:.0f} ms after start")
+
+    def on_stop(self):
+        self.root.stop_search()
+
 
 if __name__ == "__main__":
     WHApplication().run()
@@ -0,0 +1,63 @@
+"""
+Timings of the startup and of the searches, enabled with the WORDLEHELPER_PROFILE=1 environment variable.
+
+Every timing is kept in memory (for the overlay of the app), passed to the listeners and appended
+to a local log file as a "<date> <name> <milliseconds>" line. When profiling is disabled, `measure`
+and `record` do nothing.
+
+    with profiler.measure("search.filter"):
+        words = solver.search(constraints)
+
+This module does not import Kivy.
+"""
+import contextlib
+import datetime
+import os
+import threading
+import time
+
+ENABLED = os.environ.get("WORDLEHELPER_PROFILE", "") == "1"
+LOG_PATH = "profile.log"
+# How many timings are kept in memory.
+HISTORY_SIZE = 50
+
+
+class Profiler:
+    """ Records named timings. Can be used from any thread, the listeners are called on the recording thread."""
+
+    def __init__(self, enabled: bool = ENABLED, log_path: str = LOG_PATH):
+        self.enabled = enabled
+        self.log_path = log_path
+        self.timings = []
+        self.listeners = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        if not self.enabled:
+            return
+
+        milliseconds = seconds * 1000
+        with self._lock:
+            self.timings.append((name, milliseconds))
+            del self.timings[:-HISTORY_SIZE]
+            with open(self.log_path, "a", encoding="utf-8") as log_file:
+                log_file.write(f"{datetime.datetime.now().isoformat(timespec='milliseconds')} {name} "
+                               f"{milliseconds:.2f}\n")
+        for listener in self.listeners:
+            listener(name, milliseconds)
+
+    @contextlib.contextmanager
+    def measure(self, name: str):
+        """ Records the time spent in the `with` block."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+
+profiler = Profiler()
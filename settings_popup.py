@@ -0,0 +1,40 @@
+import functools
+
+from kivy.uix.popup import Popup
+
+
+@functools.lru_cache(maxsize=None)
+def read_instructions() -> str:
+    """ Reads instructions.txt once, the next popups reuse the text."""
+    with open("instructions.txt", "r", encoding='utf-8') as instructions_file:
+        instructions = instructions_file.readlines()
+    return "".join(instructions)
+
+
+class SettingsPopup(Popup):
+    """ The settings popup. It is registered in the Factory by main.py and only imported when first opened."""
+
+    def __init__(self, entry_layout, keyboard_layout, words_displayer, main_screen, guess_history, **kwargs):
+        super().__init__(**kwargs)
+        self.el = entry_layout
+        self.kl = keyboard_layout
+        self.wd = words_displayer
+        self.ms = main_screen
+        self.gh = guess_history
+        self.ids.live_search_button.state = "down" if main_screen.live_search else "normal"
+
+    def reset_game(self):
+        self.el.clear_letters()
+        self.kl.reset_letters()
+        self.gh.clear_rows()
+
+        self.wd.load_starting_words()
+        self.ms.reset_search()
+
+        self.dismiss()
+
+    def set_live_search(self, live_search: bool):
+        self.ms.live_search = live_search
+
+    def get_instructions(self):
+        return read_instructions()
@@ -0,0 +1,165 @@
+"""
+Headless Wordle solver: the constraints, the search engine and the guess ranking, without Kivy.
+
+The app only translates its widgets into a `Constraints` object and displays what the `Solver` returns,
+so the same code can be run from scripts, benchmarks or a server.
+
+    solver = Solver()
+    words = solver.search(Constraints(known=[("a", 1)], existent=["e"], nonexistent=["s", "o"]))
+    guesses = solver.suggest(5)
+"""
+import os
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import database
+from feedback import GREEN, GREY, MATRIX_PATH, FeedbackMatrix, pattern_states, suggest_guesses
+from word_filter import IncrementalSearch, create_word_index
+from wordpack import PACK_PATH, WordPack
+
+MEMORY_BACKEND = "memory"
+SQL_BACKEND = "sql"
+
+
+class Constraints(NamedTuple):
+    """
+    What is known about the word:
+        known               - (letter, position) pairs of the GREEN letters
+        existent            - the YELLOW letters (in the word)
+        nonexistent         - the RED letters (not in the word)
+        forbidden_positions - (letter, position) pairs: the letter is in the word, but not at this position
+        min_counts          - (letter, count) pairs: the letter appears at least `count` times
+        max_counts          - (letter, count) pairs: the letter appears at most `count` times
+    The fields are in the order the search engines take them.
+    """
+    known: Sequence[tuple[str, int]] = ()
+    existent: Sequence[str] = ()
+    nonexistent: Sequence[str] = ()
+    forbidden_positions: Sequence[tuple[str, int]] = ()
+    min_counts: Sequence[tuple[str, int]] = ()
+    max_counts: Sequence[tuple[str, int]] = ()
+
+
+def constraints_from_feedback(rows: Sequence[tuple[str, int]]) -> Constraints:
+    """
+    :returns the constraints given by the guesses played so far.
+    :param rows: (guess, pattern) pairs, see feedback.feedback_pattern
+
+    For every row, a letter that is GREEN or YELLOW n times appears at least n times, and if it is also
+    GREY it appears exactly n times (0 times makes it RED). YELLOW and GREY tiles forbid their position.
+    """
+    known = set()
+    forbidden_positions = set()
+    minimums = {}
+    maximums = {}
+    for guess, pattern in rows:
+        states = pattern_states(pattern, len(guess))
+        for letter in set(guess):
+            letter_states = [state for guess_letter, state in zip(guess, states) if guess_letter == letter]
+            found = sum(state != GREY for state in letter_states)
+            minimums[letter] = max(found, minimums.get(letter, 0))
+            if GREY in letter_states:
+                maximums[letter] = min(found, maximums.get(letter, len(guess)))
+
+        for index, (letter, state) in enumerate(zip(guess, states)):
+            if state == GREEN:
+                known.add((letter, index))
+            else:
+                forbidden_positions.add((letter, index))
+
+    # The positions of the RED letters are already covered.
+    forbidden_positions = {(letter, index) for letter, index in forbidden_positions if maximums.get(letter) != 0}
+    return Constraints(known=sorted(known, key=lambda item: item[1]),
+                       existent=sorted(letter for letter, count in minimums.items() if count),
+                       nonexistent=sorted(letter for letter, count in maximums.items() if not count),
+                       forbidden_positions=sorted(forbidden_positions, key=lambda item: (item[1], item[0])),
+                       min_counts=sorted((letter, count) for letter, count in minimums.items() if count > 1),
+                       max_counts=sorted((letter, count) for letter, count in maximums.items() if count))
+
+
+def merge_constraints(*constraints: Constraints) -> Constraints:
+    """ :returns the constraints that require everything the given `constraints` require."""
+    known = set()
+    existent = set()
+    nonexistent = set()
+    forbidden_positions = set()
+    minimums = {}
+    maximums = {}
+    for item in constraints:
+        known.update(item.known)
+        existent.update(item.existent)
+        nonexistent.update(item.nonexistent)
+        forbidden_positions.update(item.forbidden_positions)
+        for letter, count in item.min_counts:
+            minimums[letter] = max(count, minimums.get(letter, 0))
+        for letter, count in item.max_counts:
+            maximums[letter] = min(count, maximums.get(letter, count))
+
+    return Constraints(known=sorted(known, key=lambda item: item[1]), existent=sorted(existent),
+                       nonexistent=sorted(nonexistent),
+                       forbidden_positions=sorted(forbidden_positions, key=lambda item: (item[1], item[0])),
+                       min_counts=sorted(minimums.items()), max_counts=sorted(maximums.items()))
+
+
+class Solver:
+    """
+    Finds the words that meet the constraints and ranks the next guesses.
+    The data is loaded on the first search. A solver is not thread-safe: use it from one thread at a time.
+
+    backend:
+        "memory" - filters the words of the words pack in memory, narrowing the previous result when possible
+        "sql"    - lets SQLite filter the words (no guess suggestions)
+    """
+
+    def __init__(self, backend: str = MEMORY_BACKEND, pack_path: str = PACK_PATH, matrix_path: str = MATRIX_PATH):
+        self.backend = backend
+        self.pack_path = pack_path
+        self.matrix_path = matrix_path
+        self.word_search = None
+        # The feedback matrix used for the guess suggestions, None if it was not built (see feedback.py).
+        self.feedback_matrix = None
+
+    def load(self) -> None:
+        """ Loads the words (and the feedback matrix, if it exists). Called by the first search if needed."""
+        if self.backend == SQL_BACKEND:
+            self.word_search = database.SqlWordSearch()
+            return
+
+        word_pack = WordPack(self.pack_path)
+        self.word_search = IncrementalSearch(create_word_index(word_pack.words, word_pack.word_bytes))
+        if os.path.exists(self.matrix_path):
+            try:
+                feedback_matrix = FeedbackMatrix(self.matrix_path)
+            except ValueError:  # An unfinished build or an older file format: no suggestions.
+                return
+            # A matrix built for another words pack would suggest the wrong words (or index past its end).
+            if feedback_matrix.matches(word_pack):
+                self.feedback_matrix = feedback_matrix
+
+    def search(self, constraints: Constraints) -> list[str]:
+        """ :returns, ordered by probability, every word that meets the `constraints`."""
+        if self.word_search is None:
+            self.load()
+        return self.word_search.search(*constraints)
+
+    def suggest(self, count: int = 10) -> list[tuple[str, float]]:
+        """
+        :returns up to `count` (word, bits) pairs: the guesses with the most expected information over
+        the result of the last search. Empty if there is no feedback matrix or too many candidates.
+        """
+        if self.feedback_matrix is None or self.word_search.positions is None:
+            return []
+
+        words = self.word_search.index.words
+        return [(words[position], bits) for position, bits in
+                suggest_guesses(self.feedback_matrix, self.word_search.positions, count)]
+
+    def reset(self) -> None:
+        """ Forgets the last result, so the next search starts from the whole dictionary."""
+        if self.word_search is not None:
+            self.word_search.reset()
+
+    def close(self) -> None:
+        """ Closes the database connection used by the SQL backend."""
+        if self.backend == SQL_BACKEND:
+            database.close_connection()
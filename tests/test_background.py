@@ -0,0 +1,51 @@
+"""
+Toggling the dark mode must only change the colour of the screen background:
+no new canvas instructions and no new size/pos bindings.
+
+Run from the repository root (needs Kivy, no window is opened):
+    python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOGGLES = 20
+
+
+class BackgroundTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # style.kv and the files it refers to are relative to the repository root.
+        cls.previous_directory = os.getcwd()
+        os.chdir(ROOT)
+        sys.path.insert(0, ROOT)
+        import main
+
+        main.Builder.load_file("style.kv")
+        cls.screen = main.WHScreen()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.screen.stop_search()
+        os.chdir(cls.previous_directory)
+
+    def counts(self) -> tuple[int, int, int]:
+        return (len(self.screen.canvas.before.children), len(self.screen.get_property_observers("size")),
+                len(self.screen.get_property_observers("pos")))
+
+    def test_toggling_keeps_instructions_and_bindings(self):
+        from theme import theme
+
+        before = self.counts()
+        for _ in range(TOGGLES):
+            theme.toggle_night_mode()
+        self.assertEqual(before, self.counts())
+        self.assertEqual(list(theme.background_color), list(self.screen.background_color.rgba))
+
+
+if __name__ == "__main__":
+    unittest.main()
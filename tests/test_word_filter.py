@@ -0,0 +1,108 @@
+"""
+The search engines against the reference `check_word`, and the feedback model against Wordle's repeated-letter rules.
+
+Run from the repository root (needs no Kivy, uses NumPy if it is installed):
+    python -m unittest discover tests
+"""
+import os
+import random
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import word_filter
+from feedback import ALL_GREEN, feedback_pattern
+from solver import Constraints, constraints_from_feedback, merge_constraints
+from word_filter import IncrementalSearch, NumpyWordIndex, WordIndex, check_word
+from wordpack import PACK_PATH, WordPack
+
+# The random games are played over the most probable words, to keep the brute-force checks fast.
+VOCABULARY_SIZE = 3000
+GAMES = 300
+SEED = 0
+
+
+def vocabulary() -> list[str]:
+    return list(WordPack(os.path.join(ROOT, PACK_PATH)).words[:VOCABULARY_SIZE])
+
+
+class EnginesTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.words = vocabulary()
+        cls.indexes = {"bitmask": WordIndex(cls.words)}
+        if word_filter.numpy is not None:
+            cls.indexes["numpy"] = NumpyWordIndex(cls.words)
+
+    def assert_engines_agree(self, constraints: Constraints) -> list[str]:
+        expected = [word for word in self.words if check_word(word, *constraints)]
+        for name, index in self.indexes.items():
+            self.assertEqual(expected, list(index.filter(*constraints)), f"{name} {constraints}")
+        return expected
+
+    def test_two_letters_at_the_same_position_match_nothing(self):
+        # A GREEN input B in box 1 and a guess row CRANE with a GREEN C: c | b would be the code of d.
+        constraints = merge_constraints(Constraints(known=[("b", 0)]),
+                                        constraints_from_feedback([("crane", feedback_pattern("crane", "chair"))]))
+        self.assertEqual([], self.assert_engines_agree(constraints))
+        self.assertEqual([], self.assert_engines_agree(Constraints(known=[("c", 0), ("b", 0)])))
+
+    def test_random_feedback_games(self):
+        generator = random.Random(SEED)
+        for _ in range(GAMES):
+            answer = generator.choice(self.words)
+            searches = {name: IncrementalSearch(index) for name, index in self.indexes.items()}
+            rows = []
+            for _ in range(4):
+                guess = generator.choice(self.words)
+                rows.append((guess, feedback_pattern(guess, answer)))
+                constraints = constraints_from_feedback(rows)
+                # Often with a GREEN input too, right or (possibly conflicting with the rows) wrong.
+                if generator.random() < 0.5:
+                    index = generator.randrange(5)
+                    letter = generator.choice([answer[index], generator.choice("abcdefghijklmnopqrstuvwxyz")])
+                    constraints = merge_constraints(Constraints(known=[(letter, index)]), constraints)
+
+                expected = self.assert_engines_agree(constraints)
+                for name, search in searches.items():
+                    self.assertEqual(expected, search.search(*constraints), f"incremental {name} {constraints}")
+                if rows[-1][1] == ALL_GREEN:
+                    break
+
+
+class FeedbackTest(unittest.TestCase):
+
+    def test_repeated_letters_are_yellow_only_while_unmatched(self):
+        # LOLLY against HELLO: the 3rd and 4th L are GREEN, the 1st L is GREY (no L left), O is YELLOW.
+        self.assertEqual(0 * 1 + 1 * 3 + 2 * 9 + 2 * 27 + 0 * 81, feedback_pattern("lolly", "hello"))
+
+    def test_grey_repeated_letter_caps_the_count(self):
+        constraints = constraints_from_feedback([("lolly", feedback_pattern("lolly", "hello"))])
+        self.assertIn(("l", 2), constraints.min_counts)
+        self.assertIn(("l", 2), constraints.max_counts)
+        self.assertIn(("l", 0), constraints.forbidden_positions)
+        self.assertIn("y", constraints.nonexistent)
+
+        constraints = constraints_from_feedback([("geese", feedback_pattern("geese", "those"))])
+        self.assertIn(("e", 1), constraints.max_counts)
+        self.assertIn(("e", 4), constraints.known)
+        self.assertIn(("e", 1), constraints.forbidden_positions)
+        self.assertNotIn("e", constraints.nonexistent)
+
+    def test_constraints_are_exact(self):
+        # A word meets the constraints of the rows if and only if it gives the same feedback for every row.
+        words = vocabulary()
+        for guesses, answer in ((["lolly"], "hello"), (["geese", "speed"], "those"), (["error", "robot"], "motor"),
+                                (["llama", "allay"], "salad"), (["eerie"], "there")):
+            rows = [(guess, feedback_pattern(guess, answer)) for guess in guesses]
+            constraints = constraints_from_feedback(rows)
+            expected = [word for word in words if all(feedback_pattern(guess, word) == pattern
+                                                      for guess, pattern in rows)]
+            self.assertEqual(expected, [word for word in words if check_word(word, *constraints)], rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import datetime
+
+from kivy.event import EventDispatcher
+from kivy.properties import BooleanProperty, ColorProperty
+
+
+class Theme(EventDispatcher):
+    """
+    The colours of the app in light and dark mode.
+    Widgets bind to its properties once (in style.kv or when they are created), so toggling the dark mode
+    only updates the widgets that use a colour of the theme.
+    """
+    LIGHT = {"background_color": "#e9ecef", "text_color": (0, 0, 0, 1)}
+    DARK = {"background_color": "#495057", "text_color": (1, 1, 1, 1)}
+
+    night_mode = BooleanProperty(False)
+    background_color = ColorProperty(LIGHT["background_color"])
+    text_color = ColorProperty(LIGHT["text_color"])
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        hour = datetime.datetime.now().hour
+        self.night_mode = hour <= 6 or hour >= 18
+
+    def toggle_night_mode(self) -> None:
+        self.night_mode = not self.night_mode
+
+    def on_night_mode(self, instance, night_mode: bool) -> None:
+        colors = Theme.DARK if night_mode else Theme.LIGHT
+        self.background_color = colors["background_color"]
+        self.text_color = colors["text_color"]
+
+
+# The theme shared by every widget (style.kv imports it as `theme`).
+theme = Theme()
@@ -0,0 +1 @@
+""" Build-time helpers for WordleHelper. They are not shipped with the app."""
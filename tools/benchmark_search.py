@@ -0,0 +1,244 @@
+"""
+Benchmark harness for the search hot path.
+
+A corpus of realistic constraint sets is built by playing games (the best starting word first, then the most
+probable candidate) against seeded random answers. Every constraint set is tagged with a category:
+    early / mid / late - after the 1st / 2nd / 3rd+ guess
+    many_reds          - 8 or more RED letters
+    repeated           - the answer has a repeated letter
+
+Every engine runs in its own fresh process and is measured for
+    cold latency - loading the engine plus the first query
+    warm latency - mean / p50 / p95 / max per query over the corpus (and the mean per category)
+    throughput   - queries per second over the warm runs
+    peak memory  - traced Python/NumPy allocations and the maximum resident set size
+
+Usage (from the repository root):
+    python -m tools.benchmark_search [--games 40] [--repeats 5] [--seed 0] [--output benchmark_results.json]
+"""
+import argparse
+import datetime
+import hashlib
+import json
+import multiprocessing
+import platform
+import random
+import sqlite3
+import statistics
+import time
+import tracemalloc
+
+import database
+import word_filter
+from feedback import ALL_GREEN, feedback_pattern
+from solver import MEMORY_BACKEND, Constraints, Solver, constraints_from_feedback
+from word_filter import NumpyWordIndex, WordIndex, check_word
+from wordpack import WordPack
+
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None
+
+RESULTS_PATH = "benchmark_results.json"
+ANSWERS_POOL = 3000
+MAX_GUESSES = 6
+
+
+def opening_word() -> str:
+    with open("starting_words.txt", "r", encoding="utf-8") as words_file:
+        return next(line.split()[0] for line in words_file if line.strip() and not line.startswith("#")).lower()
+
+
+def build_corpus(games: int, seed: int) -> list[dict]:
+    """ :returns the games, each a list of {"category", "constraints"} queries in the order they were played."""
+    words = list(WordPack().words)
+    index = WordIndex(words)
+    generator = random.Random(seed)
+    pool = words[:ANSWERS_POOL]
+    repeated_pool = [word for word in pool if len(set(word)) < len(word)]
+    answers = generator.sample(pool, games - games // 4) + generator.sample(repeated_pool, games // 4)
+    opener = opening_word()
+
+    corpus = []
+    for answer in answers:
+        rows = []
+        guess = opener
+        game = []
+        for turn in range(1, MAX_GUESSES + 1):
+            pattern = feedback_pattern(guess, answer)
+            if pattern == ALL_GREEN:
+                break
+            rows.append((guess, pattern))
+            constraints = constraints_from_feedback(rows)
+            if len(set(answer)) < len(answer):
+                category = "repeated"
+            elif len(constraints.nonexistent) >= 8:
+                category = "many_reds"
+            else:
+                category = {1: "early", 2: "mid"}.get(turn, "late")
+            game.append({"category": category, "constraints": constraints})
+            guess = next(index.filter(*constraints))
+        corpus.append(game)
+    return corpus
+
+
+def original_search(constraints: Constraints) -> list[str]:
+    """
+    The search as it was first written: a new connection and a sorted scan of every row per query.
+    Words of the same probability are ordered by rowid, as in the words pack, so the results can be compared
+    (the original query left their order undefined; the query plan is the same).
+    """
+    connection = sqlite3.connect("words.sqlite")
+    words = [db_line[0] for db_line in connection.execute("SELECT word from WORDS ORDER BY probability DESC, rowid")
+             if len(db_line[0]) == 5 and check_word(db_line[0], *constraints)]
+    connection.close()
+    return words
+
+
+def load_engine(name: str):
+    """ :returns (search function, reset function) of the engine."""
+    if name == "original":
+        return original_search, None
+    if name == "check_word":
+        words = list(WordPack().words)
+        return lambda constraints: [word for word in words if check_word(word, *constraints)], None
+    if name == "bitmask":
+        index = WordIndex(WordPack().words)
+        return lambda constraints: list(index.filter(*constraints)), None
+    if name == "numpy":
+        pack = WordPack()
+        index = NumpyWordIndex(pack.words, pack.word_bytes)
+        return lambda constraints: list(index.filter(*constraints)), None
+    if name == "incremental":
+        solver = Solver(MEMORY_BACKEND)
+        return solver.search, solver.reset
+    if name == "sql":
+        return lambda constraints: database.search_words(*constraints), None
+    raise ValueError(f"unknown engine {name}")
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def trace_engine_memory(name: str, corpus: list[list[dict]]) -> float:
+    """ Runs in a fresh process. :returns the peak traced allocations (KiB) to load the engine and run the corpus."""
+    tracemalloc.start()
+    search, reset = load_engine(name)
+    for game in corpus:
+        if reset is not None:
+            reset()
+        for query in game:
+            search(query["constraints"])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def result_digests(search, reset, corpus: list[list[dict]]) -> list[str]:
+    """ :returns a hash of the words (and their order) found for every query of the corpus."""
+    digests = []
+    for game in corpus:
+        if reset is not None:
+            reset()
+        for query in game:
+            digests.append(hashlib.sha1("\n".join(search(query["constraints"])).encode()).hexdigest())
+    return digests
+
+
+def run_engine(name: str, corpus: list[list[dict]], repeats: int) -> dict:
+    """
+    Runs in a fresh process. :returns the timings of the engine (tracing the memory would slow it down)
+    and, from an extra untimed run, the hashes of the results.
+    """
+    start = time.perf_counter()
+    search, reset = load_engine(name)
+    search(corpus[0][0]["constraints"])
+    cold = time.perf_counter() - start
+
+    latencies = []
+    by_category = {}
+    warm_start = time.perf_counter()
+    for _ in range(repeats):
+        for game in corpus:
+            if reset is not None:
+                reset()
+            for query in game:
+                start = time.perf_counter()
+                search(query["constraints"])
+                elapsed = time.perf_counter() - start
+                latencies.append(elapsed)
+                by_category.setdefault(query["category"], []).append(elapsed)
+    warm_total = time.perf_counter() - warm_start
+
+    return {
+        "cold_ms": cold * 1000,
+        "warm_mean_ms": statistics.fmean(latencies) * 1000,
+        "warm_p50_ms": percentile(latencies, 0.5) * 1000,
+        "warm_p95_ms": percentile(latencies, 0.95) * 1000,
+        "warm_max_ms": max(latencies) * 1000,
+        "warm_mean_ms_by_category": {category: statistics.fmean(values) * 1000
+                                     for category, values in sorted(by_category.items())},
+        "queries_per_second": len(latencies) / warm_total,
+        "max_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+        "result_digests": result_digests(search, reset, corpus),
+    }
+
+
+def main(games: int, repeats: int, seed: int, output: str) -> None:
+    corpus = build_corpus(games, seed)
+    engines = ["original", "check_word", "bitmask", "incremental", "sql"]
+    if word_filter.numpy is not None:
+        engines.insert(3, "numpy")
+
+    measurements = {}
+    context = multiprocessing.get_context("spawn")
+    for name in engines:
+        with context.Pool(1) as pool:
+            measurements[name] = pool.apply(run_engine, (name, corpus, repeats))
+        with context.Pool(1) as pool:
+            measurements[name]["peak_traced_kib"] = pool.apply(trace_engine_memory, (name, corpus))
+
+    # Every engine must find the same words, in the same order, for every query.
+    expected = measurements["bitmask"]["result_digests"]
+    for name, measurement in measurements.items():
+        digests = measurement.pop("result_digests")
+        if digests != expected:
+            query = next(index for index, (digest, bitmask) in enumerate(zip(digests, expected)) if digest != bitmask)
+            raise AssertionError(f"{name} does not find the same words as bitmask (query {query})")
+
+    categories = {}
+    for game in corpus:
+        for query in game:
+            categories[query["category"]] = categories.get(query["category"], 0) + 1
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": getattr(word_filter.numpy, "__version__", None),
+        "corpus": {"games": games, "seed": seed, "repeats": repeats, "queries": sum(categories.values()),
+                   "categories": categories},
+        "engines": measurements,
+    }
+    with open(output, "w", encoding="utf-8") as results_file:
+        json.dump(report, results_file, indent=2)
+
+    print(f"{'engine':<12}{'cold':>10}{'warm mean':>12}{'warm p95':>12}{'queries/s':>12}{'peak KiB':>12}")
+    for name, measurement in measurements.items():
+        print(f"{name:<12}{measurement['cold_ms']:>8.1f}ms{measurement['warm_mean_ms']:>10.2f}ms"
+              f"{measurement['warm_p95_ms']:>10.2f}ms{measurement['queries_per_second']:>12.0f}"
+              f"{measurement['peak_traced_kib']:>12.0f}")
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks the search engines.")
+    parser.add_argument("--games", type=int, default=40)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=RESULTS_PATH)
+    arguments = parser.parse_args()
+
+    main(arguments.games, arguments.repeats, arguments.seed, arguments.output)
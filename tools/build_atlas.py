@@ -0,0 +1,68 @@
+"""
+Builds icons.atlas (and its icons-0.png texture) from the icon images used by style.kv. Requires Pillow.
+
+The icons are drawn in 50dp buttons, so every icon is downscaled to 50dp at the chosen density
+(4 = xxxhdpi, the densest Android screens) before being packed into a single texture.
+style.kv refers to them as atlas://icons/<name>. The original images stay in the repository
+as the sources of the atlas and are not shipped in the APK (see buildozer.spec).
+
+Usage (from the repository root):
+    python -m tools.build_atlas [--density 4] [--output icons]
+"""
+import argparse
+import os
+import tempfile
+
+from PIL import Image
+
+# Atlas name of every icon and the image it is made from.
+ICONS = {
+    "dark_light_mode": "DarkLightModeIcon.png",
+    "settings": "SettingsIcon2.png",
+}
+ICON_DP = 50
+ATLAS_NAME = "icons"
+
+
+def power_of_two(minimum: int) -> int:
+    """ :returns the smallest power of two that is at least `minimum` (the texture sizes GPUs handle best)."""
+    power = 1
+    while power < minimum:
+        power *= 2
+    return power
+
+
+def build_atlas(density: float = 4, output: str = ATLAS_NAME) -> list[str]:
+    """ :returns the files written (the .atlas file first, then the textures)."""
+    # Imported here: Kivy parses the command line arguments when it is imported.
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    from kivy.atlas import Atlas
+
+    size = round(ICON_DP * density)
+    with tempfile.TemporaryDirectory() as scaled_dir:
+        filenames = []
+        for name, source in ICONS.items():
+            image = Image.open(source).convert("RGBA")
+            image.thumbnail((size, size), Image.LANCZOS)
+            filenames.append(os.path.join(scaled_dir, name + ".png"))
+            image.save(filenames[-1], optimize=True)
+
+        # A single texture, the icons side by side with the padding around each of them.
+        texture_size = (power_of_two(len(filenames) * (size + 4)), power_of_two(size + 4))
+        atlas_path, meta = Atlas.create(output, filenames, texture_size)
+
+    textures = [os.path.join(os.path.dirname(output), texture) for texture in meta]
+    for texture in textures:
+        # Kivy saves the texture without compression.
+        Image.open(texture).save(texture, optimize=True)
+    return [atlas_path] + textures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Packs the downscaled icons into a Kivy atlas.")
+    parser.add_argument("--density", type=float, default=4, help="pixels per dp of the downscaled icons")
+    parser.add_argument("--output", default=ATLAS_NAME, help="atlas name (without extension)")
+    arguments = parser.parse_args()
+
+    for path in build_atlas(arguments.density, arguments.output):
+        print(f"{path}: {os.path.getsize(path) / 1024:.1f} KiB")
@@ -0,0 +1,109 @@
+"""
+Builds feedback.matrix (see feedback.py) for the words of words5.pack. Requires NumPy.
+
+The guess axis is split into shards that a process pool computes in parallel, each worker writing
+its rows straight into the memory-mapped output file. Finished shards are recorded in a
+`<output>.progress` file, so an interrupted build continues where it stopped when run again.
+The header is written last, so an unfinished file is never accepted by `FeedbackMatrix`.
+
+Usage (from the repository root):
+    python -m tools.build_feedback_matrix [--pack words5.pack] [--output feedback.matrix]
+                                          [--workers N] [--shard-rows 256]
+"""
+import argparse
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy
+
+from feedback import HEADER, MATRIX_PATH, pack_checksum, pattern_row, write_matrix_header
+from wordpack import PACK_PATH, WordPack
+
+_pack = None
+_letters = None
+
+
+def _load_pack(pack_path: str) -> None:
+    """ Process pool initializer: every worker maps the words pack once."""
+    global _pack, _letters
+    _pack = WordPack(pack_path)
+    _letters = numpy.frombuffer(_pack.word_bytes, dtype=numpy.uint8).reshape(-1, _pack.word_length)
+
+
+def _build_shard(matrix_path: str, first_row: int, last_row: int) -> tuple[int, int]:
+    """ Computes the rows [first_row, last_row) and writes them into the output file."""
+    count = len(_pack)
+    with open(matrix_path, "r+b") as matrix_file:
+        output = mmap.mmap(matrix_file.fileno(), 0)
+        try:
+            for guess in range(first_row, last_row):
+                start = HEADER.size + guess * count
+                output[start:start + count] = pattern_row(_pack.words[guess], _letters).tobytes()
+            output.flush()
+        finally:
+            output.close()
+    return first_row, last_row
+
+
+def _read_progress(progress_path: str) -> set[int]:
+    """ :returns the rows of the finished shards (a resumed build may use another --shard-rows)."""
+    if not os.path.exists(progress_path):
+        return set()
+    done = set()
+    with open(progress_path, "r", encoding="utf-8") as progress_file:
+        for line in progress_file:
+            if line.strip():
+                first_row, last_row = map(int, line.split())
+                done.update(range(first_row, last_row))
+    return done
+
+
+def build_feedback_matrix(pack_path: str = PACK_PATH, matrix_path: str = MATRIX_PATH, workers: int = None,
+                          shard_rows: int = 256) -> int:
+    """ :returns the number of words (rows and columns) of the matrix."""
+    word_pack = WordPack(pack_path)
+    count = len(word_pack)
+    size = HEADER.size + count * count
+    progress_path = matrix_path + ".progress"
+
+    done = _read_progress(progress_path)
+    if not done or not os.path.exists(matrix_path) or os.path.getsize(matrix_path) != size:
+        # Nothing to resume: start from an empty file of the final size, without a valid header yet.
+        done = set()
+        with open(matrix_path, "wb") as matrix_file:
+            matrix_file.truncate(size)
+        open(progress_path, "w", encoding="utf-8").close()
+
+    # A shard is only skipped if all its rows were built, partly built shards are built again.
+    shards = [(first_row, min(first_row + shard_rows, count)) for first_row in range(0, count, shard_rows)
+              if not done.issuperset(range(first_row, min(first_row + shard_rows, count)))]
+    print(f"{len(shards)} shards of {shard_rows} rows to build ({len(done)} rows already done)")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_load_pack, initargs=(pack_path,)) as executor, \
+            open(progress_path, "a", encoding="utf-8") as progress_file:
+        futures = [executor.submit(_build_shard, matrix_path, first_row, last_row) for first_row, last_row in shards]
+        for finished, future in enumerate(as_completed(futures), start=1):
+            first_row, last_row = future.result()
+            progress_file.write(f"{first_row} {last_row}\n")
+            progress_file.flush()
+            os.fsync(progress_file.fileno())
+            print(f"\r{finished}/{len(shards)} shards", end="", flush=True)
+    print()
+
+    with open(matrix_path, "r+b") as matrix_file:
+        write_matrix_header(matrix_file, count, pack_checksum(word_pack))
+    os.remove(progress_path)
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Builds the guess x answer feedback matrix.")
+    parser.add_argument("--pack", default=PACK_PATH)
+    parser.add_argument("--output", default=MATRIX_PATH)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--shard-rows", type=int, default=256, help="guess rows per shard")
+    arguments = parser.parse_args()
+
+    total = build_feedback_matrix(arguments.pack, arguments.output, arguments.workers, arguments.shard_rows)
+    print(f"{total} x {total} patterns written to {arguments.output}")
@@ -0,0 +1,37 @@
+"""
+Builds the `five_letter_words` table inside words.sqlite.
+
+The app only ever needs the 5-letter words, so instead of scanning every row of
+`words` and sorting them on each search, this table holds only those words,
+already ordered by probability (the `rank` column is the rowid, so reading the
+table in rowid order needs no sort).
+
+Usage (from the repository root):
+    python -m tools.build_index [path/to/words.sqlite]
+"""
+import sqlite3
+import sys
+
+WORD_LENGTH = 5
+INDEX_TABLE = "five_letter_words"
+
+
+def build_index(db_path: str = "words.sqlite") -> int:
+    """ (Re)creates the index table and :returns the number of words stored in it."""
+    connection = sqlite3.connect(db_path)
+    with connection:
+        connection.execute(f"DROP TABLE IF EXISTS {INDEX_TABLE}")
+        connection.execute(f"CREATE TABLE {INDEX_TABLE}("
+                           "rank INTEGER PRIMARY KEY, word TEXT NOT NULL, probability INTEGER NOT NULL)")
+        connection.execute(f"INSERT INTO {INDEX_TABLE}(word, probability) "
+                           "SELECT word, probability FROM words WHERE length(word) = ? "
+                           "ORDER BY probability DESC, rowid", (WORD_LENGTH,))
+    count = connection.execute(f"SELECT count(*) FROM {INDEX_TABLE}").fetchone()[0]
+    connection.execute("VACUUM")
+    connection.close()
+    return count
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "words.sqlite"
+    print(f"{build_index(path)} words written to {INDEX_TABLE} in {path}")
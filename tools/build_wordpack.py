@@ -0,0 +1,26 @@
+"""
+Builds words5.pack (see wordpack.py) from the `five_letter_words` table of words.sqlite.
+
+Usage (from the repository root):
+    python -m tools.build_wordpack [path/to/words.sqlite] [path/to/words5.pack]
+"""
+import sqlite3
+import sys
+
+from wordpack import PACK_PATH, write_pack
+
+
+def build_wordpack(db_path: str = "words.sqlite", pack_path: str = PACK_PATH) -> int:
+    """ :returns the number of words written."""
+    connection = sqlite3.connect(db_path)
+    rows = connection.execute("SELECT word, probability FROM five_letter_words ORDER BY rank").fetchall()
+    connection.close()
+
+    write_pack(pack_path, [word for word, _ in rows], [probability for _, probability in rows])
+    return len(rows)
+
+
+if __name__ == "__main__":
+    db = sys.argv[1] if len(sys.argv) > 1 else "words.sqlite"
+    pack = sys.argv[2] if len(sys.argv) > 2 else PACK_PATH
+    print(f"{build_wordpack(db, pack)} words written to {pack}")
@@ -0,0 +1,66 @@
+"""
+Regenerates starting_words.txt: the openers that split the whole dictionary best.
+Requires NumPy. Uses feedback.matrix when it was built, otherwise the patterns are computed on the fly.
+
+Every word is scored against every 5-letter word as a possible answer, by
+    entropy   - expected information of the feedback, in bits (higher is better)
+    remaining - expected number of candidates left after the guess (lower is better)
+
+Usage (from the repository root):
+    python -m tools.generate_starting_words [--metric entropy|remaining] [--count 50] [--output starting_words.txt]
+"""
+import argparse
+import os
+
+import numpy
+
+from feedback import MATRIX_PATH, FeedbackMatrix, entropies, expected_remaining, pattern_counts, pattern_row
+from wordpack import PACK_PATH, WordPack
+
+STARTING_WORDS_PATH = "starting_words.txt"
+METRICS = {
+    "entropy": (entropies, "bits", True),
+    "remaining": (expected_remaining, "words left", False),
+}
+
+
+def score_openers(metric: str, chunk_rows: int = 512):
+    """ :returns the score of every word of the pack as an opener."""
+    pack = WordPack(PACK_PATH)
+    score, _, _ = METRICS[metric]
+    matrix = FeedbackMatrix(MATRIX_PATH) if os.path.exists(MATRIX_PATH) else None
+    if matrix is not None and not matrix.matches(pack):
+        raise ValueError(f"{MATRIX_PATH} was built for another words pack, rebuild it")
+    letters = numpy.frombuffer(pack.word_bytes, dtype=numpy.uint8).reshape(-1, pack.word_length)
+
+    scores = numpy.empty(len(pack))
+    for first_row in range(0, len(pack), chunk_rows):
+        last_row = min(first_row + chunk_rows, len(pack))
+        if matrix is not None and matrix.patterns is not None:
+            patterns = matrix.patterns[first_row:last_row]
+        else:
+            patterns = numpy.stack([pattern_row(pack.words[guess], letters) for guess in range(first_row, last_row)])
+        scores[first_row:last_row] = score(pattern_counts(patterns))
+    return pack, scores
+
+
+def generate_starting_words(metric: str = "entropy", count: int = 50, output: str = STARTING_WORDS_PATH) -> None:
+    pack, scores = score_openers(metric)
+    _, unit, higher_is_better = METRICS[metric]
+    order = numpy.argsort(-scores if higher_is_better else scores, kind="stable")[:count]
+
+    with open(output, "w", encoding="utf-8") as words_file:
+        words_file.write(f"# {metric} ({unit}) over all {len(pack)} five-letter words\n")
+        for position in order:
+            words_file.write(f"{pack.words[position].upper()} {scores[position]:.2f}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ranks the best starting words.")
+    parser.add_argument("--metric", choices=sorted(METRICS), default="entropy")
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--output", default=STARTING_WORDS_PATH)
+    arguments = parser.parse_args()
+
+    generate_starting_words(arguments.metric, arguments.count, arguments.output)
+    print(f"{arguments.count} starting words written to {arguments.output}")
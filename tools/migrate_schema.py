@@ -0,0 +1,60 @@
+"""
+Rebuilds the `words` table of words.sqlite with precomputed columns and indexes:
+    length      - length of the word
+    c0 .. c4    - the letter at each position (only for 5-letter words, NULL otherwise)
+    mask        - the 26-bit letter-presence mask (see word_filter.letters_mask)
+
+The indexes turn the `ORDER BY probability DESC` into an index scan and green-letter
+lookups into index seeks. The migration is idempotent: the table is always rebuilt from
+its `word` and `probability` columns (keeping the rowids), so running it again gives the same file.
+
+Usage (from the repository root):
+    python -m tools.migrate_schema [path/to/words.sqlite]
+"""
+import sqlite3
+import sys
+
+from word_filter import WORD_LENGTH, letters_mask
+
+POSITION_COLUMNS = [f"c{index}" for index in range(WORD_LENGTH)]
+
+INDEXES = [
+    "CREATE INDEX words_length_probability ON words(length, probability DESC, word)",
+    "CREATE INDEX words_letters ON words(c0, c1, c2, c3, c4) WHERE length = 5",
+] + [f"CREATE INDEX words_{column}_probability ON words({column}, probability DESC) WHERE length = 5"
+     for column in POSITION_COLUMNS]
+
+
+def word_mask(word: str) -> int:
+    """ :returns the presence mask of the letters of `word`, ignoring anything that is not a-z (e.g. '-')."""
+    return letters_mask(letter for letter in word if "a" <= letter <= "z")
+
+
+def migrate(db_path: str = "words.sqlite") -> None:
+    connection = sqlite3.connect(db_path)
+    connection.create_function("letters_mask", 1, word_mask, deterministic=True)
+
+    position_columns = ", ".join(f"{column} TEXT" for column in POSITION_COLUMNS)
+    position_values = ", ".join(f"CASE WHEN length(word) = {WORD_LENGTH} THEN substr(word, {index + 1}, 1) END"
+                                for index in range(WORD_LENGTH))
+    with connection:
+        connection.execute("DROP TABLE IF EXISTS words_migrated")
+        connection.execute("CREATE TABLE words_migrated(word TEXT, probability INTEGER, "
+                           f"length INTEGER, {position_columns}, mask INTEGER)")
+        connection.execute(f"INSERT INTO words_migrated(rowid, word, probability, length, "
+                           f"{', '.join(POSITION_COLUMNS)}, mask) "
+                           f"SELECT rowid, word, probability, length(word), {position_values}, letters_mask(word) "
+                           "FROM words ORDER BY rowid")
+        connection.execute("DROP TABLE words")
+        connection.execute("ALTER TABLE words_migrated RENAME TO words")
+        for index in INDEXES:
+            connection.execute(index)
+        connection.execute("ANALYZE")
+    connection.execute("VACUUM")
+    connection.close()
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "words.sqlite"
+    migrate(path)
+    print(f"{path} migrated")
@@ -0,0 +1,143 @@
+"""
+Plays every answer of the 5-letter dictionary against a guessing strategy and reports how many guesses it needs.
+Requires NumPy and feedback.matrix (see tools/build_feedback_matrix.py).
+
+Strategies (the guess is picked among all the words, a word that can still be the answer wins ties):
+    probability - the most probable remaining candidate, the order the app lists the words in
+    entropy     - the guess with the most expected information over the remaining candidates
+    minimax     - the guess whose largest group of remaining candidates is the smallest
+
+Games are not played one by one: the strategy is deterministic, so all the answers that gave the same feedback
+share the rest of the game. The game tree is split by the feedback of the first guess and the subtrees are
+played in parallel by a process pool.
+
+Usage (from the repository root):
+    python -m tools.simulate [--strategy entropy] [--answers N] [--workers N] [--output simulation.json]
+"""
+import argparse
+import json
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy
+
+from feedback import ALL_GREEN, MATRIX_PATH, FeedbackMatrix, entropies, expected_remaining, pattern_counts
+from wordpack import PACK_PATH, WordPack
+
+STRATEGIES = ("probability", "entropy", "minimax")
+# A game is lost after this many guesses, but it is played on to get the whole distribution.
+MAX_GUESSES = 6
+MAX_TURNS = 20
+CHUNK_ROWS = 1024
+
+_patterns = None
+
+
+def _load_matrix(matrix_path: str) -> None:
+    """ Process pool initializer: every worker maps the feedback matrix once."""
+    global _patterns
+    _patterns = FeedbackMatrix(matrix_path).patterns
+
+
+def choose_guess(strategy: str, candidates) -> int:
+    """ :returns the position (in the words pack) of the next guess for the `candidates` (pack order)."""
+    if strategy == "probability" or len(candidates) <= 2:
+        return int(candidates[0])
+
+    guess_count = _patterns.shape[0]
+    scores = numpy.empty(guess_count)
+    tie_breaks = numpy.zeros(guess_count)
+    for first_row in range(0, guess_count, CHUNK_ROWS):
+        counts = pattern_counts(_patterns[first_row:first_row + CHUNK_ROWS][:, candidates])
+        if strategy == "entropy":
+            scores[first_row:first_row + len(counts)] = entropies(counts)
+        else:
+            scores[first_row:first_row + len(counts)] = -counts.max(axis=1)
+            tie_breaks[first_row:first_row + len(counts)] = -expected_remaining(counts)
+
+    is_candidate = numpy.zeros(guess_count, dtype=bool)
+    is_candidate[candidates] = True
+    # lexsort sorts by the last key first: best score, then tie break, then candidates, then pack order.
+    return int(numpy.lexsort((numpy.arange(guess_count), ~is_candidate, -tie_breaks, -scores))[0])
+
+
+def play(strategy: str, candidates, guess: int, turn: int) -> Counter:
+    """
+    Plays `guess` as guess number `turn` against every answer in `candidates`, then the rest of the games.
+    :returns how many answers were found after each number of guesses (None for the unfinished games).
+    """
+    results = Counter()
+    row = _patterns[guess, candidates]
+    for pattern in numpy.unique(row):
+        group = candidates[row == pattern]
+        if pattern == ALL_GREEN:
+            results[turn] += len(group)
+        elif turn >= MAX_TURNS:
+            results[None] += len(group)
+        else:
+            results += play(strategy, group, choose_guess(strategy, group), turn + 1)
+    return results
+
+
+def _play_group(strategy: str, group) -> Counter:
+    return play(strategy, group, choose_guess(strategy, group), 2)
+
+
+def simulate(strategy: str, answers: int = None, workers: int = None, matrix_path: str = MATRIX_PATH) -> dict:
+    """ :returns the guess-count distribution and its statistics for the `strategy`."""
+    if not FeedbackMatrix(matrix_path).matches(WordPack(PACK_PATH)):
+        raise ValueError(f"{matrix_path} was built for another words pack, rebuild it")
+    _load_matrix(matrix_path)
+    candidates = numpy.arange(answers or _patterns.shape[0], dtype=numpy.intp)
+    opener = choose_guess(strategy, candidates)
+
+    # The first guess splits the answers into independent groups, played in parallel.
+    results = Counter()
+    row = _patterns[opener, candidates]
+    groups = []
+    for pattern in numpy.unique(row):
+        group = candidates[row == pattern]
+        if pattern == ALL_GREEN:
+            results[1] += len(group)
+        else:
+            groups.append(group)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_load_matrix, initargs=(matrix_path,)) as executor:
+        for group_results in executor.map(_play_group, [strategy] * len(groups), groups):
+            results += group_results
+
+    solved = {turns: count for turns, count in results.items() if turns is not None}
+    total = sum(results.values())
+    failures = sum(count for turns, count in solved.items() if turns > MAX_GUESSES) + results[None]
+    return {
+        "strategy": strategy,
+        "opener": WordPack(PACK_PATH).words[opener],
+        "answers": total,
+        "distribution": {str(turns): solved[turns] for turns in sorted(solved)},
+        "unfinished": results[None],
+        "mean_guesses": sum(turns * count for turns, count in solved.items()) / max(1, sum(solved.values())),
+        "failure_rate": failures / total,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plays every answer against a strategy.")
+    parser.add_argument("--strategy", choices=STRATEGIES, nargs="+", default=list(STRATEGIES))
+    parser.add_argument("--answers", type=int, default=None, help="only the N most probable words are answers")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--output", default=None, help="also write the reports to this JSON file")
+    arguments = parser.parse_args()
+
+    reports = []
+    for strategy_name in arguments.strategy:
+        start = time.perf_counter()
+        report = simulate(strategy_name, arguments.answers, arguments.workers)
+        report["seconds"] = time.perf_counter() - start
+        reports.append(report)
+        print(f"{strategy_name:<12} opener {report['opener']}  mean {report['mean_guesses']:.3f}  "
+              f"failures {report['failure_rate']:.2%}  ({report['seconds']:.0f}s)")
+        print("    " + "  ".join(f"{turns}: {count}" for turns, count in report["distribution"].items()))
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump(reports, output_file, indent=2)
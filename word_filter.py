@@ -0,0 +1,375 @@
+"""
+Bitmask based filtering engine for the 5-letter words.
+
+Every word is encoded only once into two integers:
+    mask  - a 26-bit letter-presence mask (bit 0 is 'a', bit 25 is 'z')
+    codes - the 5 letters packed into 5 bits each (position 0 in the lowest bits)
+
+A query is then compiled into the same representation, so checking a word costs a few
+integer AND/compare operations instead of repeated substring tests.
+
+The full Wordle feedback (see solver.constraints_from_feedback) also needs two wider integers per word:
+    repeats - bit 26 * (k - 2) + letter is set when the letter appears at least k times (k = 2..5)
+    places  - bit 26 * position + letter is set for every letter of the word
+so minimum/maximum letter counts and forbidden positions are checked the same way.
+
+When NumPy is installed, `create_word_index` returns a `NumpyWordIndex` that evaluates a
+query over the whole vocabulary with a few boolean array operations instead.
+
+This module does not import Kivy, so it can be used (and benchmarked) without the app.
+"""
+from collections.abc import Sequence
+from typing import Iterable, Iterator
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, the pure-Python engine is used without it.
+    numpy = None
+
+WORD_LENGTH = 5
+ALPHABET_SIZE = 26
+BITS_PER_LETTER = 5
+LETTER_BITS = (1 << BITS_PER_LETTER) - 1
+
+
+def letter_code(letter: str) -> int:
+    """ :returns the code of a lowercase letter ('a' is 0, 'z' is 25)."""
+    return ord(letter) - 97
+
+
+def letters_mask(letters: Iterable[str]) -> int:
+    """ :returns the presence mask of the `letters`."""
+    mask = 0
+    for letter in letters:
+        mask |= 1 << letter_code(letter)
+    return mask
+
+
+def positions_code(word: str) -> int:
+    """ :returns the letters of the `word` packed into a single integer."""
+    code = 0
+    for index, letter in enumerate(word):
+        code |= letter_code(letter) << (BITS_PER_LETTER * index)
+    return code
+
+
+def encode_word(word: str) -> tuple[int, int]:
+    """ :returns the (mask, codes) pair of the `word`."""
+    return letters_mask(word), positions_code(word)
+
+
+def repeat_bit(letter: str, count: int) -> int:
+    """ :returns the `repeats` bit meaning "`letter` appears at least `count` (2..5) times"."""
+    return 1 << (ALPHABET_SIZE * (count - 2) + letter_code(letter))
+
+
+def place_bit(letter: str, index: int) -> int:
+    """ :returns the `places` bit meaning "`letter` is at position `index`"."""
+    return 1 << (ALPHABET_SIZE * index + letter_code(letter))
+
+
+def repeats_code(word: str) -> int:
+    """ :returns the `repeats` integer of the `word`."""
+    code = 0
+    for letter in set(word):
+        for count in range(2, word.count(letter) + 1):
+            code |= repeat_bit(letter, count)
+    return code
+
+
+def places_code(word: str) -> int:
+    """ :returns the `places` integer of the `word`."""
+    code = 0
+    for index, letter in enumerate(word):
+        code |= place_bit(letter, index)
+    return code
+
+
+class WordIndex:
+    """ The encoded vocabulary. The order of the words is kept (it is the probability order)."""
+
+    def __init__(self, words: Iterable[str]):
+        self.words = list(words)
+        self.masks = []
+        self.codes = []
+        self.repeats = []
+        self.places = []
+        for word in self.words:
+            mask, codes = encode_word(word)
+            self.masks.append(mask)
+            self.codes.append(codes)
+            self.repeats.append(repeats_code(word))
+            self.places.append(places_code(word))
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def filter(self, known_letters: list[tuple[str, int]], existent_letters: list[str],
+               nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+               min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = ()) -> Iterator[str]:
+        return filter_words(self, known_letters, existent_letters, nonexistent_letters, forbidden_positions,
+                            min_counts, max_counts)
+
+    def matching_positions(self, known_letters: list[tuple[str, int]], existent_letters: list[str],
+                           nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+                           min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = (),
+                           candidates: list[int] = None) -> list[int]:
+        """
+        :returns the positions (in order) of the words that meet the specified requirements.
+        If `candidates` is given only those positions are checked.
+        """
+        (required, forbidden, positions_mask, positions_value,
+         required_repeats, forbidden_repeats, forbidden_places) = compile_query(known_letters, existent_letters,
+                                                                                nonexistent_letters,
+                                                                                forbidden_positions,
+                                                                                min_counts, max_counts)
+        masks = self.masks
+        codes = self.codes
+        if candidates is None:
+            candidates = range(len(self.words))
+
+        positions = [position for position in candidates
+                     if masks[position] & required == required and not masks[position] & forbidden
+                     and codes[position] & positions_mask == positions_value]
+        if required_repeats or forbidden_repeats or forbidden_places:
+            repeats = self.repeats
+            places = self.places
+            positions = [position for position in positions
+                         if repeats[position] & required_repeats == required_repeats
+                         and not repeats[position] & forbidden_repeats and not places[position] & forbidden_places]
+        return positions
+
+
+class NumpyWordIndex:
+    """
+    The encoded vocabulary as NumPy arrays:
+        letters - (N, 5) uint8 array with the ASCII codes of every word
+        masks   - (N,) uint32 array with the letter-presence mask of every word
+    `word_bytes` (the words concatenated, e.g. a view into a words pack) is used without copying when given.
+    """
+
+    def __init__(self, words: Iterable[str], word_bytes=None):
+        self.words = words if isinstance(words, Sequence) else list(words)
+        if word_bytes is None:
+            word_bytes = "".join(self.words).encode("ascii")
+        self.letters = numpy.frombuffer(word_bytes, dtype=numpy.uint8).reshape(-1, WORD_LENGTH)
+        codes = (self.letters - 97).astype(numpy.uint32)
+        self.masks = numpy.bitwise_or.reduce(numpy.left_shift(numpy.uint32(1), codes), axis=1)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def filter(self, known_letters: list[tuple[str, int]], existent_letters: list[str],
+               nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+               min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = ()) -> Iterator[str]:
+        """ Yields, in order, each word that meets the specified requirements."""
+        words = self.words
+        return (words[position] for position in
+                self.matching_positions(known_letters, existent_letters, nonexistent_letters, forbidden_positions,
+                                        min_counts, max_counts))
+
+    def matching_positions(self, known_letters: list[tuple[str, int]], existent_letters: list[str],
+                           nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+                           min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = (),
+                           candidates=None):
+        """
+        :returns an array with the positions (in order) of the words that meet the specified requirements.
+        If `candidates` is given only those positions are checked.
+        """
+        required = letters_mask(existent_letters) | letters_mask(letter for letter, count in min_counts if count)
+        forbidden = letters_mask(nonexistent_letters) | letters_mask(letter for letter, count in max_counts
+                                                                     if not count)
+
+        if candidates is None:
+            masks, letters = self.masks, self.letters
+        else:
+            candidates = numpy.asarray(candidates, dtype=numpy.intp)
+            masks, letters = self.masks[candidates], self.letters[candidates]
+
+        matches = (masks & required) == required
+        if forbidden:
+            matches &= (masks & forbidden) == 0
+        for letter, index in known_letters:
+            matches &= letters[:, index] == ord(letter)
+        for letter, index in forbidden_positions:
+            matches &= letters[:, index] != ord(letter)
+        for letter, count in min_counts:
+            if count > 1:
+                matches &= (letters == ord(letter)).sum(axis=1) >= count
+        for letter, count in max_counts:
+            if count > 0:
+                matches &= (letters == ord(letter)).sum(axis=1) <= count
+
+        positions = numpy.flatnonzero(matches)
+        return positions if candidates is None else candidates[positions]
+
+
+def create_word_index(words: Iterable[str], word_bytes=None):
+    """ :returns a `NumpyWordIndex` if NumPy is available, a `WordIndex` otherwise."""
+    if numpy is not None:
+        return NumpyWordIndex(words, word_bytes)
+    return WordIndex(words)
+
+
+def compile_query(known_letters: list[tuple[str, int]], existent_letters: list[str],
+                  nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+                  min_counts: list[tuple[str, int]] = (),
+                  max_counts: list[tuple[str, int]] = ()) -> tuple[int, int, int, int, int, int, int]:
+    """
+    Translates the requirements into integers:
+        :returns (required_mask, forbidden_mask, positions_mask, positions_value,
+                  required_repeats, forbidden_repeats, forbidden_places)
+    """
+    required = letters_mask(existent_letters)
+    forbidden = letters_mask(nonexistent_letters)
+
+    positions_mask = 0
+    positions_value = 0
+    for letter, index in known_letters:
+        shift = BITS_PER_LETTER * index
+        if positions_mask >> shift & LETTER_BITS and positions_value >> shift & LETTER_BITS != letter_code(letter):
+            # Two different letters at the same position (e.g. a GREEN input and a guess row): no word matches.
+            # OR-ing their codes would match a third letter instead, so the letter is required and forbidden.
+            required |= letters_mask(letter)
+            forbidden |= letters_mask(letter)
+        positions_mask |= LETTER_BITS << shift
+        positions_value |= letter_code(letter) << shift
+
+    required_repeats = 0
+    for letter, count in min_counts:
+        if count >= 1:
+            required |= letters_mask(letter)
+        if count >= 2:
+            required_repeats |= repeat_bit(letter, count)
+
+    forbidden_repeats = 0
+    for letter, count in max_counts:
+        if count == 0:
+            forbidden |= letters_mask(letter)
+        elif count < WORD_LENGTH:
+            forbidden_repeats |= repeat_bit(letter, count + 1)
+
+    forbidden_places = 0
+    for letter, index in forbidden_positions:
+        forbidden_places |= place_bit(letter, index)
+
+    return (required, forbidden, positions_mask, positions_value,
+            required_repeats, forbidden_repeats, forbidden_places)
+
+
+def filter_words(index: WordIndex, known_letters: list[tuple[str, int]], existent_letters: list[str],
+                 nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+                 min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = ()) -> Iterator[str]:
+    """ Generator that yields, in order, each word of the `index` that meets the specified requirements."""
+    if forbidden_positions or min_counts or max_counts:
+        words = index.words
+        yield from (words[position] for position in
+                    index.matching_positions(known_letters, existent_letters, nonexistent_letters,
+                                             forbidden_positions, min_counts, max_counts))
+        return
+
+    required, forbidden, positions_mask, positions_value, _, _, _ = compile_query(known_letters, existent_letters,
+                                                                                  nonexistent_letters)
+    for word, mask, codes in zip(index.words, index.masks, index.codes):
+        if mask & required == required and not mask & forbidden and codes & positions_mask == positions_value:
+            yield word
+
+
+def check_word(word: str, known_letters: list[tuple[str, int]], existent_letters: list[str],
+               nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+               min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = ()) -> bool:
+    """
+    The original (string based) check, kept as a reference for `filter_words`.
+    Checks the if yellow letters are in the word.
+    then checks if the red letters are not in the word,
+    then checks if the letters in the 5 Inputs letters are in the correct position,
+    then checks the forbidden positions and the letter counts.
+    """
+    for existent_letter in existent_letters:
+        if existent_letter not in word:
+            return False
+
+    for nonexistent_letter in nonexistent_letters:
+        if nonexistent_letter in word:
+            return False
+
+    for letter, index in known_letters:
+        if word[index] != letter:
+            return False
+
+    for letter, index in forbidden_positions:
+        if word[index] == letter:
+            return False
+
+    for letter, count in min_counts:
+        if word.count(letter) < count:
+            return False
+
+    for letter, count in max_counts:
+        if word.count(letter) > count:
+            return False
+    return True
+
+
+class IncrementalSearch:
+    """
+    Remembers the last result and the requirements it was computed under.
+    When the new requirements only add to the previous ones, only the previous
+    result is filtered, otherwise (or after `reset`) the whole vocabulary is searched.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.requirements = None
+        self.positions = None
+
+    def reset(self) -> None:
+        self.requirements = None
+        self.positions = None
+
+    @staticmethod
+    def normalize(known_letters, existent_letters, nonexistent_letters, forbidden_positions, min_counts,
+                  max_counts) -> tuple[frozenset, frozenset, frozenset, frozenset]:
+        """
+        :returns the requirements as (known, forbidden positions, minimum counts, maximum counts),
+        the counts being frozensets of (letter, count) with one count per letter.
+        """
+        minimums = dict.fromkeys(existent_letters, 1)
+        for letter, count in min_counts:
+            minimums[letter] = max(count, minimums.get(letter, 0))
+        maximums = dict.fromkeys(nonexistent_letters, 0)
+        for letter, count in max_counts:
+            maximums[letter] = min(count, maximums.get(letter, WORD_LENGTH))
+
+        return (frozenset(known_letters), frozenset(forbidden_positions),
+                frozenset(minimums.items()), frozenset(maximums.items()))
+
+    def is_tightening(self, requirements: tuple[frozenset, ...]) -> bool:
+        """ :returns True if every previous requirement is implied by the new `requirements`."""
+        if self.requirements is None:
+            return False
+
+        known, forbidden_positions, minimums, maximums = requirements
+        old_known, old_forbidden_positions, old_minimums, old_maximums = self.requirements
+        new_minimums = dict(minimums)
+        new_maximums = dict(maximums)
+        return (old_known <= known and old_forbidden_positions <= forbidden_positions
+                and all(new_minimums.get(letter, 0) >= count for letter, count in old_minimums)
+                and all(new_maximums.get(letter, WORD_LENGTH) <= count for letter, count in old_maximums))
+
+    def search(self, known_letters: list[tuple[str, int]], existent_letters: list[str],
+               nonexistent_letters: list[str], forbidden_positions: list[tuple[str, int]] = (),
+               min_counts: list[tuple[str, int]] = (), max_counts: list[tuple[str, int]] = ()) -> list[str]:
+        """ :returns, in order, every word that meets the specified requirements."""
+        requirements = self.normalize(known_letters, existent_letters, nonexistent_letters, forbidden_positions,
+                                      min_counts, max_counts)
+
+        if requirements != self.requirements:
+            candidates = self.positions if self.is_tightening(requirements) else None
+            self.positions = self.index.matching_positions(known_letters, existent_letters, nonexistent_letters,
+                                                           forbidden_positions, min_counts, max_counts,
+                                                           candidates=candidates)
+            self.requirements = requirements
+
+        words = self.index.words
+        return [words[position] for position in self.positions]
@@ -0,0 +1,75 @@
+"""
+Compact binary format for the sorted 5-letter words, loaded with `mmap` (no copy, no parsing).
+
+Layout (little endian):
+    header       - magic b"WHWP", version (u8), word length (u8), frequency width in bytes (u16), word count (u32)
+    words        - count * word length ASCII bytes, ordered by probability
+    frequencies  - count unsigned integers of the given width (the `probability` of each word)
+
+The file is built from words.sqlite by tools/build_wordpack.py.
+"""
+import mmap
+import struct
+from collections.abc import Sequence
+
+PACK_PATH = "words5.pack"
+MAGIC = b"WHWP"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHI")
+FREQUENCY_FORMATS = {2: "H", 4: "I"}
+
+
+class PackedWords(Sequence):
+    """ Read-only sequence of the words stored in a buffer, decoded only when accessed."""
+
+    def __init__(self, word_bytes: memoryview, word_length: int):
+        self.word_bytes = word_bytes
+        self.word_length = word_length
+
+    def __len__(self) -> int:
+        return len(self.word_bytes) // self.word_length
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[index] for index in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("word position out of range")
+        start = position * self.word_length
+        return str(self.word_bytes[start:start + self.word_length], "ascii")
+
+
+class WordPack:
+    """ A memory-mapped words pack. `word_bytes` and `frequencies` are views into the mapped file."""
+
+    def __init__(self, path: str = PACK_PATH):
+        with open(path, "rb") as pack_file:
+            self._mmap = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, word_length, frequency_width, count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} words pack")
+
+        buffer = memoryview(self._mmap)
+        words_end = HEADER.size + count * word_length
+        self.word_length = word_length
+        self.word_bytes = buffer[HEADER.size:words_end]
+        # The file is little endian, as are all the platforms the app runs on.
+        self.frequencies = buffer[words_end:words_end + count * frequency_width].cast(
+            FREQUENCY_FORMATS[frequency_width])
+        self.words = PackedWords(self.word_bytes, word_length)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+def write_pack(path: str, words: list[str], frequencies: list[int]) -> None:
+    """ Writes the `words` (already sorted) and their `frequencies` into a words pack."""
+    word_length = len(words[0])
+    frequency_width = 2 if max(frequencies) <= 0xFFFF else 4
+
+    with open(path, "wb") as pack_file:
+        pack_file.write(HEADER.pack(MAGIC, VERSION, word_length, frequency_width, len(words)))
+        pack_file.write("".join(words).encode("ascii"))
+        pack_file.write(struct.pack(f"<{len(frequencies)}{FREQUENCY_FORMATS[frequency_width]}", *frequencies))